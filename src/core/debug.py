@@ -0,0 +1,6 @@
+"""Debug switches shared by the core widgets."""
+
+import os
+
+# Per-event debug messages are only formatted when CYGNUS_DEBUG is set
+DEBUG = os.environ.get("CYGNUS_DEBUG", "") not in ("", "0")
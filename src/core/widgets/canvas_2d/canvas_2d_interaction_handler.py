@@ -1,13 +1,25 @@
 """Interaction handler for 2D canvas widget."""
 
-from PySide6.QtCore import QObject, Qt
-from PySide6.QtGui import QKeyEvent, QMouseEvent, QWheelEvent
+import pyqtgraph as pg
+from PySide6.QtCore import QEvent, QObject, Qt
+from PySide6.QtGui import QKeyEvent, QMouseEvent, QPainter, QWheelEvent
 
 from .canvas_2d_qviewmodel import Canvas2DQViewModel
+from .signal_throttler import SignalThrottler
+from src.core.debug import DEBUG
 from src.util.logger import Logger
 
 log = Logger(__name__)
 
+# Pre-resolved enum members used on every mouse event
+_LEFT = Qt.MouseButton.LeftButton
+# Flag masks as plain ints, so tests avoid allocating QFlags objects per event
+_LEFT_INT = Qt.MouseButton.LeftButton.value
+_CTRL_INT = Qt.KeyboardModifier.ControlModifier.value
+_PRESS = QEvent.Type.MouseButtonPress
+_MOVE = QEvent.Type.MouseMove
+_RELEASE = QEvent.Type.MouseButtonRelease
+
 
 class Canvas2DInteractionHandler(QObject):
     """Handles user interactions with the canvas using eventFilter."""
@@ -23,10 +35,29 @@ class Canvas2DInteractionHandler(QObject):
         self._view_model = view_model
         self._plot_widget = plot_widget
         
+        # Cache the view box and widget size to avoid Qt calls per mouse event
+        self._view_box = self._plot_widget.getViewBox()
+        self._widget_width = self._plot_widget.width()
+        self._widget_height = self._plot_widget.height()
         
         # Track mouse drag state
         self._is_dragging = False
         self._drag_start_pos = None
+        # Antialiasing settings to restore once a drag ends
+        self._saved_antialias: tuple[bool, bool] | None = None
+        
+        # Accumulate pan deltas and apply them at most once per frame
+        self._pending_pan_dx = 0.0
+        self._pending_pan_dy = 0.0
+        self._pan_throttler = SignalThrottler(interval_ms=16, leading=True, parent=self)
+        self._pan_throttler.triggered.connect(self._apply_pending_pan)
+        
+        # Mouse event handlers by event type
+        self._mouse_dispatch = {
+            _PRESS: self._on_press,
+            _MOVE: self._on_move,
+            _RELEASE: self._on_release,
+        }
         
         # Install event filter on plot widget
         self._plot_widget.installEventFilter(self)
@@ -44,6 +75,12 @@ class Canvas2DInteractionHandler(QObject):
         if obj != self._plot_widget:
             return False
         
+        # Keep the cached widget size current
+        if event.type() == QEvent.Type.Resize:
+            self._widget_width = self._plot_widget.width()
+            self._widget_height = self._plot_widget.height()
+            return False
+        
         # Handle mouse events
         if isinstance(event, QMouseEvent):
             return self._handle_mouse_event(event)
@@ -65,76 +102,124 @@ class Canvas2DInteractionHandler(QObject):
         :param event: Mouse event
         :return: True if event was handled, False otherwise
         """
-        # Get mouse position in plot coordinates
-        pos = event.position()
-        view_box = self._plot_widget.getViewBox()
-        scene_pos = view_box.mapSceneToView(pos)
-        x, y = scene_pos.x(), scene_pos.y()
-        
-        if event.type() == QMouseEvent.Type.MouseButtonPress:
-            if event.button() == Qt.MouseButton.LeftButton:
-                modifiers = event.modifiers()
-                
-                if modifiers & Qt.KeyboardModifier.ControlModifier:
-                    # Ctrl+LeftClick: Delete point
-                    log.d(f"Ctrl+LeftClick at ({x}, {y}) - attempting to delete point")
-                    if self._view_model.delete_point_near(x, y, threshold=10.0):
-                        return True
-                else:
-                    # LeftClick: Add point or start drag
-                    log.d(f"LeftClick at ({x}, {y}) - adding point")
-                    self._view_model.add_point(x, y)
-                    self._is_dragging = False
-                    self._drag_start_pos = (x, y)
-                    return True
-        
-        elif event.type() == QMouseEvent.Type.MouseMove:
-            if event.buttons() & Qt.MouseButton.LeftButton:
-                if self._drag_start_pos is not None:
-                    # Check if we've moved enough to consider it a drag
-                    dx = x - self._drag_start_pos[0]
-                    dy = y - self._drag_start_pos[1]
-                    distance = (dx ** 2 + dy ** 2) ** 0.5
-                    
-                    if distance > 5.0:  # Threshold for drag detection
-                        if not self._is_dragging:
-                            self._is_dragging = True
-                            log.d("Starting pan drag")
-                        
-                        # Pan the view
-                        view_box = self._plot_widget.getViewBox()
-                        current_range = view_box.viewRange()
-                        x_range = current_range[0]
-                        y_range = current_range[1]
-                        
-                        # Calculate pan delta
-                        pan_dx = -dx * (x_range[1] - x_range[0]) / self._plot_widget.width()
-                        pan_dy = dy * (y_range[1] - y_range[0]) / self._plot_widget.height()
-                        
-                        # Apply pan
-                        view_box.setXRange(
-                            x_range[0] + pan_dx,
-                            x_range[1] + pan_dx,
-                            padding=0
-                        )
-                        view_box.setYRange(
-                            y_range[0] + pan_dy,
-                            y_range[1] + pan_dy,
-                            padding=0
-                        )
-                        
-                        self._drag_start_pos = (x, y)
-                        return True
+        handler = self._mouse_dispatch.get(event.type())
+        return handler(event) if handler is not None else False
+
+    def _map_to_view(self, event: QMouseEvent) -> tuple[float, float]:
+        """
+        Get the mouse position of an event in plot coordinates.
+
+        :param event: Mouse event
+        :return: Tuple of (x, y) plot coordinates
+        """
+        scene_pos = self._view_box.mapSceneToView(event.position())
+        return scene_pos.x(), scene_pos.y()
+
+    def _on_press(self, event: QMouseEvent) -> bool:
+        """
+        Handle mouse button presses.
+
+        :param event: Mouse event
+        :return: True if event was handled, False otherwise
+        """
+        if event.button() != _LEFT:
+            return False
         
-        elif event.type() == QMouseEvent.Type.MouseButtonRelease:
-            if event.button() == Qt.MouseButton.LeftButton:
-                if self._is_dragging:
-                    log.d("Ending pan drag")
-                    self._is_dragging = False
-                self._drag_start_pos = None
-                return True
+        x, y = self._map_to_view(event)
+        if event.modifiers().value & _CTRL_INT:
+            # Ctrl+LeftClick: Delete point
+            if DEBUG:
+                log.d(f"Ctrl+LeftClick at ({x}, {y}) - attempting to delete point")
+            return self._view_model.delete_point_near(x, y, threshold=10.0)
         
-        return False
+        # LeftClick: Add point or start drag
+        if DEBUG:
+            log.d(f"LeftClick at ({x}, {y}) - adding point")
+        self._view_model.add_point(x, y)
+        self._is_dragging = False
+        self._drag_start_pos = (x, y)
+        return True
+
+    def _on_move(self, event: QMouseEvent) -> bool:
+        """
+        Handle mouse moves, panning the view while the left button is dragged.
+
+        :param event: Mouse event
+        :return: True if event was handled, False otherwise
+        """
+        if self._drag_start_pos is None or not event.buttons().value & _LEFT_INT:
+            return False
+        
+        # Check if we've moved enough to consider it a drag
+        x, y = self._map_to_view(event)
+        dx = x - self._drag_start_pos[0]
+        dy = y - self._drag_start_pos[1]
+        distance = (dx ** 2 + dy ** 2) ** 0.5
+        
+        if distance <= 5.0:  # Threshold for drag detection
+            return False
+        
+        if not self._is_dragging:
+            self._is_dragging = True
+            self._disable_antialiasing()
+            log.d("Starting pan drag")
+        
+        # Pan the view
+        current_range = self._view_box.viewRange()
+        x_range = current_range[0]
+        y_range = current_range[1]
+        
+        # Calculate pan delta
+        pan_dx = -dx * (x_range[1] - x_range[0]) / self._widget_width
+        pan_dy = dy * (y_range[1] - y_range[0]) / self._widget_height
+        
+        # Queue the pan; it is applied at most once per frame
+        self._pending_pan_dx += pan_dx
+        self._pending_pan_dy += pan_dy
+        self._pan_throttler.throttle()
+        
+        self._drag_start_pos = (x, y)
+        return True
+
+    def _on_release(self, event: QMouseEvent) -> bool:
+        """
+        Handle mouse button releases, ending any pan drag.
+
+        :param event: Mouse event
+        :return: True if event was handled, False otherwise
+        """
+        if event.button() != _LEFT:
+            return False
+        
+        if self._is_dragging:
+            log.d("Ending pan drag")
+            self._is_dragging = False
+            self._restore_antialiasing()
+        self._drag_start_pos = None
+        return True
+
+    def _disable_antialiasing(self):
+        """Switch antialiasing off for the duration of a drag, remembering the previous settings."""
+        view_antialias = bool(self._plot_widget.renderHints() & QPainter.RenderHint.Antialiasing)
+        self._saved_antialias = (pg.getConfigOption("antialias"), view_antialias)
+        pg.setConfigOptions(antialias=False)
+        self._plot_widget.setAntialiasing(False)
+
+    def _restore_antialiasing(self):
+        """Restore the antialiasing settings saved when the drag started."""
+        if self._saved_antialias is None:
+            return
+        config_antialias, view_antialias = self._saved_antialias
+        self._saved_antialias = None
+        pg.setConfigOptions(antialias=config_antialias)
+        self._plot_widget.setAntialiasing(view_antialias)
+
+    def _apply_pending_pan(self):
+        """Apply the accumulated pan delta as a single range update (one repaint)."""
+        if self._pending_pan_dx or self._pending_pan_dy:
+            self._view_box.translateBy(x=self._pending_pan_dx, y=self._pending_pan_dy)
+            self._pending_pan_dx = 0.0
+            self._pending_pan_dy = 0.0
 
     def _handle_wheel_event(self, event: QWheelEvent) -> bool:
         """
@@ -143,16 +228,14 @@ class Canvas2DInteractionHandler(QObject):
         :param event: Wheel event
         :return: True if event was handled, False otherwise
         """
-        modifiers = event.modifiers()
-        
-        if modifiers & Qt.KeyboardModifier.ControlModifier:
+        if event.modifiers().value & _CTRL_INT:
             # Ctrl+Scroll: Zoom
             delta = event.angleDelta().y()
             zoom_factor = 1.1 if delta > 0 else 0.9
             
             log.d(f"Ctrl+Scroll: zooming by factor {zoom_factor}")
             
-            view_box = self._plot_widget.getViewBox()
+            view_box = self._view_box
             current_range = view_box.viewRange()
             x_range = current_range[0]
             y_range = current_range[1]
@@ -182,8 +265,7 @@ class Canvas2DInteractionHandler(QObject):
                 y_center + y_width / 2 + y_offset
             ]
             
-            view_box.setXRange(new_x_range[0], new_x_range[1], padding=0)
-            view_box.setYRange(new_y_range[0], new_y_range[1], padding=0)
+            view_box.setRange(xRange=new_x_range, yRange=new_y_range, padding=0)
             
             return True
         
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-import uuid
+import itertools
 
-from PySide6.QtCore import QObject, Signal
+import numpy as np
+from PySide6.QtCore import QObject, Qt, Signal
 
+from src.core.debug import DEBUG
 from src.util.logger import Logger
 
 from .plot_data.canvas_2d_plot_data import Canvas2DPlotData
@@ -13,6 +15,8 @@ from .plot_data.plot_data_2d_enum import PlotData2D
 from .plot_data.point_data_2d import PointData2D
 from .plot_data.polygon_data_2d import PolygonData2D
 from .plot_data.polyline_data_2d import PolylineData2D
+from .plot_data.undo_commands import AddPointCmd, AddPointsCmd, RemovePointCmd
+from .signal_throttler import SignalThrottler
 
 log = Logger(__name__)
 
@@ -20,8 +24,8 @@ log = Logger(__name__)
 class Canvas2DQViewModel(QObject):
     """ViewModel for managing 2D canvas data and interactions."""
 
-    # Signal emitted when the UI needs to be updated
-    update_requested = Signal()
+    # Signal emitted with the set of changed plot IDs when the UI needs to be updated
+    update_requested = Signal(set)
 
     def __init__(self):
         """Initialize the view model."""
@@ -29,9 +33,21 @@ class Canvas2DQViewModel(QObject):
         self._plot_data = Canvas2DPlotData()
         self._current_plot_type = PlotData2D.POINT
         self._current_plot_id: str | None = None
+        # Per-type handlers used by delete_point_near
+        self._delete_handlers = {
+            PlotData2D.POINT: self._delete_from_point,
+            PlotData2D.POLYLINE: self._delete_from_vertices,
+            PlotData2D.POLYGON: self._delete_from_vertices,
+        }
+        # Process-local counter for generating plot and point IDs
+        self._id_counter = itertools.count()
+        
+        # Coalesce bursts of data changes into at most one UI update per frame
+        self._update_throttler = SignalThrottler(interval_ms=16, leading=True, parent=self)
+        self._update_throttler.triggered.connect(self._emit_update_requested)
         
         # Connect plot data changes to update signal
-        self._plot_data.data_changed.connect(self._on_data_changed)
+        self._plot_data.data_changed.connect(self._on_data_changed, Qt.ConnectionType.UniqueConnection)
         
         log.d("Initialized Canvas2DQViewModel")
 
@@ -52,10 +68,19 @@ class Canvas2DQViewModel(QObject):
         self._current_plot_type = value
         self._current_plot_id = None
 
+    @property
+    def current_plot_id(self) -> str | None:
+        """Get the ID of the polyline or polygon currently being drawn, if any."""
+        return self._current_plot_id
+
     def _on_data_changed(self):
         """Handle data changed signal from plot data."""
         log.d("Data changed, requesting UI update")
-        self.update_requested.emit()
+        self._update_throttler.throttle()
+
+    def _emit_update_requested(self):
+        """Request a UI update for the plots that changed since the last one."""
+        self.update_requested.emit(set(self._plot_data.dirty_ids))
 
     def add_point(self, x: float, y: float):
         """
@@ -64,50 +89,76 @@ class Canvas2DQViewModel(QObject):
         :param x: X coordinate
         :param y: Y coordinate
         """
-        log.d(f"Adding point at ({x}, {y})")
+        if DEBUG:
+            log.d(f"Adding point at ({x}, {y})")
         
         if self._current_plot_type == PlotData2D.POINT:
             # Create a new point plot
-            point_id = f"point_{uuid.uuid4().hex[:8]}"
+            point_id = f"point_{next(self._id_counter):08x}"
             point = PointData2D(point_id, x, y, color="r", deletable=True)
             self._plot_data.add_plot(point)
-            log.d(f"Created new point plot: {point_id}")
-        
-        elif self._current_plot_type == PlotData2D.POLYLINE:
-            # Add point to current polyline or create new one
-            if self._current_plot_id is None:
-                # Create new polyline
-                self._current_plot_id = f"polyline_{uuid.uuid4().hex[:8]}"
-                polyline = PolylineData2D(self._current_plot_id, color="b")
-                self._plot_data.add_plot(polyline)
-                log.d(f"Created new polyline: {self._current_plot_id}")
-            
-            polyline = self._plot_data.get_plot(self._current_plot_id)
-            if isinstance(polyline, PolylineData2D):
-                # Save state before adding point for undo support
-                self._plot_data.save_state_for_undo()
-                point_id = f"point_{uuid.uuid4().hex[:8]}"
-                point = PointData2D(point_id, x, y, color=polyline.color, deletable=True)
-                polyline.add_point(point)
-                self._plot_data.data_changed.emit()
+            if DEBUG:
+                log.d(f"Created new point plot: {point_id}")
+        
+        else:
+            # Add point to current polyline/polygon or create new one
+            plot = self._get_or_create_current_plot()
+            if plot is not None:
+                point_id = f"point_{next(self._id_counter):08x}"
+                plot.add_point(point_id, x, y)
+                # Record the addition for undo support
+                self._plot_data.push_undo(AddPointCmd(plot.id, point_id, x, y))
+
+    def add_points_bulk(self, xs: np.ndarray, ys: np.ndarray):
+        """
+        Add many points to the current polyline or polygon at once.
+
+        The points are recorded as a single undo step and trigger a single UI update.
+
+        :param xs: X coordinates
+        :param ys: Y coordinates
+        """
+        plot = self._get_or_create_current_plot()
+        if plot is None:
+            log.w(f"Bulk point addition is not supported for {self._current_plot_type.value} plots")
+            return
+        
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        if len(xs) != len(ys):
+            raise ValueError("xs and ys must have the same length")
         
+        if len(xs) == 0:
+            return
+        
+        counter = self._id_counter
+        point_ids = [f"point_{next(counter):08x}" for _ in range(len(xs))]
+        log.d(f"Adding {len(point_ids)} points to {plot.type.value} {plot.id}")
+        plot.add_points(point_ids, xs, ys)
+        # Record the whole batch as one undo step
+        self._plot_data.push_undo(AddPointsCmd(plot.id, point_ids, xs, ys))
+
+    def _get_or_create_current_plot(self) -> PolylineData2D | PolygonData2D | None:
+        """
+        Get the polyline or polygon currently being drawn, creating a new one if needed.
+
+        :return: Current polyline or polygon, or None if the current plot type is not one
+        """
+        if self._current_plot_type == PlotData2D.POLYLINE:
+            plot_class, prefix, color = PolylineData2D, "polyline", "b"
         elif self._current_plot_type == PlotData2D.POLYGON:
-            # Add point to current polygon or create new one
-            if self._current_plot_id is None:
-                # Create new polygon
-                self._current_plot_id = f"polygon_{uuid.uuid4().hex[:8]}"
-                polygon = PolygonData2D(self._current_plot_id, color="g")
-                self._plot_data.add_plot(polygon)
-                log.d(f"Created new polygon: {self._current_plot_id}")
-            
-            polygon = self._plot_data.get_plot(self._current_plot_id)
-            if isinstance(polygon, PolygonData2D):
-                # Save state before adding point for undo support
-                self._plot_data.save_state_for_undo()
-                point_id = f"point_{uuid.uuid4().hex[:8]}"
-                point = PointData2D(point_id, x, y, color=polygon.color, deletable=True)
-                polygon.add_point(point)
-                self._plot_data.data_changed.emit()
+            plot_class, prefix, color = PolygonData2D, "polygon", "g"
+        else:
+            return None
+        
+        if self._current_plot_id is None:
+            self._current_plot_id = f"{prefix}_{next(self._id_counter):08x}"
+            self._plot_data.add_plot(plot_class(self._current_plot_id, color=color))
+            if DEBUG:
+                log.d(f"Created new {prefix}: {self._current_plot_id}")
+        
+        plot = self._plot_data.get_plot(self._current_plot_id)
+        return plot if isinstance(plot, plot_class) else None
 
     def delete_point_near(self, x: float, y: float, threshold: float = 10.0) -> bool:
         """
@@ -118,29 +169,63 @@ class Canvas2DQViewModel(QObject):
         :param threshold: Distance threshold in pixels (default: 10.0)
         :return: True if a point was deleted, False otherwise
         """
-        log.d(f"Attempting to delete point near ({x}, {y}) with threshold {threshold}")
+        if DEBUG:
+            log.d(f"Attempting to delete point near ({x}, {y}) with threshold {threshold}")
         
         # Search through all plots to find a deletable point within threshold
+        delete_handlers = self._delete_handlers
         for plot in self._plot_data.get_all_plots():
-            if isinstance(plot, PointData2D):
-                if plot.deletable and plot.distance_to(x, y) <= threshold:
-                    log.d(f"Deleting point {plot.id}")
-                    self._plot_data.remove_plot(plot.id)
-                    return True
-            
-            elif isinstance(plot, (PolylineData2D, PolygonData2D)):
-                for point in plot.points:
-                    if point.deletable and point.distance_to(x, y) <= threshold:
-                        log.d(f"Deleting point {point.id} from {plot.type.value} {plot.id}")
-                        # Save state before deletion for undo support
-                        self._plot_data.save_state_for_undo()
-                        plot.remove_point(point.id)
-                        self._plot_data.data_changed.emit()
-                        return True
+            handler = delete_handlers.get(plot.type)
+            if handler is not None and handler(plot, x, y, threshold):
+                return True
         
         log.d("No deletable point found within threshold")
         return False
 
+    def _delete_from_point(self, plot: PointData2D, x: float, y: float, threshold: float) -> bool:
+        """
+        Delete a point plot if it is within threshold of the given coordinates.
+
+        :param plot: Point plot to check
+        :param x: X coordinate
+        :param y: Y coordinate
+        :param threshold: Distance threshold
+        :return: True if the plot was deleted, False otherwise
+        """
+        # Compare squared distances to avoid a square root
+        if not plot.deletable or plot.distance2_to(x, y) > threshold * threshold:
+            return False
+        if DEBUG:
+            log.d(f"Deleting point {plot.id}")
+        self._plot_data.remove_plot(plot.id)
+        return True
+
+    def _delete_from_vertices(
+        self, plot: PolylineData2D | PolygonData2D, x: float, y: float, threshold: float
+    ) -> bool:
+        """
+        Delete the nearest deletable vertex of a polyline or polygon within threshold.
+
+        :param plot: Polyline or polygon to check
+        :param x: X coordinate
+        :param y: Y coordinate
+        :param threshold: Distance threshold
+        :return: True if a vertex was deleted, False otherwise
+        """
+        # Cheap reject before scanning the vertices
+        if not plot.bbox_hit(x, y, threshold):
+            return False
+        index = plot.nearest_within(x, y, threshold)
+        if index is None:
+            return False
+        point = plot.points[index]
+        if DEBUG:
+            log.d(f"Deleting point {point.id} from {plot.type.value} {plot.id}")
+        plot.remove_point(point.id)
+        # Record the removal for undo support
+        self._plot_data.push_undo(RemovePointCmd(plot.id, point, index))
+        return True
+
     def undo(self):
         """Undo the last action."""
         log.d("Undo requested")
@@ -180,8 +265,8 @@ class Canvas2DQViewModel(QObject):
         self._plot_data = new_plot_data
         
         # Reconnect signal
-        self._plot_data.data_changed.connect(self._on_data_changed)
+        self._plot_data.data_changed.connect(self._on_data_changed, Qt.ConnectionType.UniqueConnection)
         
         # Emit update signal
-        self.update_requested.emit()
+        self._emit_update_requested()
         log.d("Plot data replacement complete")
@@ -1,10 +1,15 @@
 """2D Canvas widget using PyQtGraph."""
 
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Set
 
+import numpy as np
 import pyqtgraph as pg
-from PySide6.QtWidgets import QWidget, QVBoxLayout
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QBrush, QPen
+from PySide6.QtWidgets import QGraphicsItem, QWidget, QVBoxLayout
 
+from src.core.debug import DEBUG
 from src.util.logger import Logger
 
 from .canvas_2d_qviewmodel import Canvas2DQViewModel
@@ -19,6 +24,32 @@ from .plot_data.polyline_data_2d import PolylineData2D
 
 log = Logger(__name__)
 
+
+@lru_cache(maxsize=256)
+def _pen(color: str, width: int) -> QPen:
+    """
+    Get a shared pen for the given color and width.
+
+    Pens are expensive to construct, so one instance is reused per (color, width).
+
+    :param color: Color string
+    :param width: Line width in pixels
+    :return: Cached QPen
+    """
+    return pg.mkPen(color=color, width=width)
+
+
+@lru_cache(maxsize=256)
+def _brush(color: str) -> QBrush:
+    """
+    Get a shared brush for the given color.
+
+    :param color: Color string
+    :return: Cached QBrush
+    """
+    return pg.mkBrush(color=color)
+
+
 class Canvas2DQWidget(QWidget):
     """2D Canvas widget using PyQtGraph for rendering."""
 
@@ -42,11 +73,31 @@ class Canvas2DQWidget(QWidget):
         self._plot_widget.setXRange(0, 100)
         self._plot_widget.setYRange(0, 100)
         
+        # Plot data container the items were rendered from
+        self._rendered_plot_data = view_model.plot_data
         # Store plot items for tracking
         self._plot_items: Dict[str, pg.GraphicsObject] = {}
+        # Renderers by plot type; each plot type maps to exactly one data class
+        self._renderers = {
+            PlotData2D.POINT: self._render_point,
+            PlotData2D.POLYLINE: self._render_polyline,
+            PlotData2D.POLYGON: self._render_polygon,
+        }
+        # Color each plot item was last styled with, to restyle only on change
+        self._item_colors: Dict[str, str] = {}
+        # Plot being drawn by the user; its item is redrawn too often to be worth caching
+        self._editing_plot_id: str | None = None
+        # Point plots share one scatter item per color instead of one item each
+        self._point_scatters: Dict[str, pg.ScatterPlotItem] = {}
+        # Coordinates of the point plots by color, then by plot ID
+        self._point_coords: Dict[str, Dict[str, tuple[float, float]]] = {}
+        # Color each point plot is drawn with
+        self._point_colors: Dict[str, str] = {}
+        # Colors whose shared scatter item needs new data
+        self._stale_point_colors: Set[str] = set()
         
         # Connect to view model update signal
-        self._view_model.update_requested.connect(self.update)
+        self._view_model.update_requested.connect(self._on_update_requested, Qt.ConnectionType.UniqueConnection)
         
         # Set up layout
         layout = QVBoxLayout()
@@ -56,32 +107,63 @@ class Canvas2DQWidget(QWidget):
         
         log.d("Initialized Canvas2DQWidget")
 
-    def update(self):
+    def _on_update_requested(self, dirty_ids: Set[str]):
         """
-        Update the UI by rendering all plot data that needs updating.
+        Update the UI by rendering the plot data that changed.
         
         This method gets the Canvas2DPlotData instance from the view model,
-        filters plot data where update==True, and updates the UI accordingly.
+        re-renders only the plots whose IDs are in dirty_ids, and removes
+        items for plots that no longer exist.
+
+        :param dirty_ids: IDs of the plots that changed since the last update
         """
-        log.d("Update method called")
+        log.d("Update requested")
         
         plot_data: Canvas2DPlotData = self._view_model.plot_data
-        plots_to_update = plot_data.get_plots_to_update()
-        
-        log.d(f"Updating {len(plots_to_update)} plots")
+        plots_to_update = [
+            plot for plot in map(plot_data.get_plot, dirty_ids) if plot is not None
+        ]
         
-        # Update or create plot items
-        for plot in plots_to_update:
-            self._render_plot(plot)
+        if DEBUG:
+            log.d(f"Updating {len(plots_to_update)} plots")
         
-        # Remove plots that no longer exist
-        existing_plot_ids = {plot.id for plot in plot_data.get_all_plots()}
-        plot_ids_to_remove = set(self._plot_items.keys()) - existing_plot_ids
-        
-        for plot_id in plot_ids_to_remove:
-            log.d(f"Removing plot item {plot_id}")
-            item = self._plot_items.pop(plot_id)
-            self._plot_widget.removeItem(item)
+        # Batch the item changes: no repaints and no auto-range recomputation
+        # per added or removed item, just one of each at the end
+        view_box = self._plot_widget.getPlotItem().getViewBox()
+        auto_range = view_box.autoRangeEnabled()
+        self._plot_widget.setUpdatesEnabled(False)
+        view_box.disableAutoRange()
+        try:
+            # Stop caching the plot being edited before it is re-rendered
+            self._refresh_cache_modes()
+            
+            # Update or create plot items
+            for plot in plots_to_update:
+                self._render_plot(plot)
+            
+            # Remove plots that no longer exist
+            plot_ids = plot_data.get_plot_ids()
+            if plot_data is self._rendered_plot_data:
+                # Only plots removed since the last update can have stale items
+                plot_ids_to_remove = [
+                    plot_id for plot_id in plot_data.removed_ids if plot_id not in plot_ids
+                ]
+            else:
+                # The container was replaced, so any item it does not back is stale
+                plot_ids_to_remove = (self._plot_items.keys() | self._point_colors.keys()) - plot_ids
+                self._rendered_plot_data = plot_data
+            
+            for plot_id in plot_ids_to_remove:
+                self._remove_item(plot_id)
+                self._discard_point(plot_id)
+            
+            # Push the collected point changes to the shared scatter items
+            self._flush_point_scatters()
+        finally:
+            if any(auto_range):
+                view_box.enableAutoRange(x=auto_range[0], y=auto_range[1])
+            self._plot_widget.setUpdatesEnabled(True)
+            self._plot_widget.update()
         
         # Mark all plots as updated
         plot_data.mark_all_updated()
@@ -94,24 +176,10 @@ class Canvas2DQWidget(QWidget):
 
         :param plot: Plot data to render
         """
-        plot_id = plot.id
-        
-        # Remove existing item if it exists
-        if plot_id in self._plot_items:
-            log.d(f"Removing existing plot item {plot_id}")
-            item = self._plot_items.pop(plot_id)
-            self._plot_widget.removeItem(item)
-        
-        # Create new plot item based on type
-        if plot.type == PlotData2D.POINT and isinstance(plot, PointData2D):
-            self._render_point(plot)
-        
-        elif plot.type == PlotData2D.POLYLINE and isinstance(plot, PolylineData2D):
-            self._render_polyline(plot)
-        
-        elif plot.type == PlotData2D.POLYGON and isinstance(plot, PolygonData2D):
-            self._render_polygon(plot)
-        
+        # Update the existing item for this plot, or create one if needed
+        renderer = self._renderers.get(plot.type)
+        if renderer is not None:
+            renderer(plot)
         else:
             log.w(f"Unknown plot type: {plot.type}")
 
@@ -121,20 +189,60 @@ class Canvas2DQWidget(QWidget):
 
         :param point: Point data to render
         """
-        log.d(f"Rendering point {point.id} at ({point.x}, {point.y})")
+        if DEBUG:
+            log.d(f"Rendering point {point.id} at ({point.x}, {point.y})")
         
-        # Create scatter plot item for point
-        scatter = pg.ScatterPlotItem(
-            [point.x],
-            [point.y],
-            pen=pg.mkPen(color=point.color, width=2),
-            brush=pg.mkBrush(color=point.color),
-            size=10,
-            symbol="o"
-        )
+        # Record the point; the shared scatter item for its color is refreshed after the batch
+        color = point.color
+        if self._point_colors.get(point.id, color) != color:
+            self._discard_point(point.id)
+        self._point_colors[point.id] = color
+        self._point_coords.setdefault(color, {})[point.id] = (point.x, point.y)
+        self._stale_point_colors.add(color)
+
+    def _discard_point(self, plot_id: str):
+        """
+        Drop a point plot from the shared scatter item it is drawn by.
+
+        :param plot_id: ID of the point plot
+        """
+        color = self._point_colors.pop(plot_id, None)
+        if color is not None:
+            del self._point_coords[color][plot_id]
+            self._stale_point_colors.add(color)
+
+    def _flush_point_scatters(self):
+        """Update the shared scatter item of every color whose points changed."""
+        for color in self._stale_point_colors:
+            coords = self._point_coords.get(color)
+            scatter = self._point_scatters.get(color)
+            
+            if not coords:
+                # No points left in this color
+                self._point_coords.pop(color, None)
+                if scatter is not None:
+                    del self._point_scatters[color]
+                    self._plot_widget.removeItem(scatter)
+                continue
+            
+            xy = np.array(list(coords.values()), dtype=np.float64)
+            if scatter is not None:
+                scatter.setData(x=xy[:, 0], y=xy[:, 1])
+                continue
+            
+            scatter = pg.ScatterPlotItem(
+                xy[:, 0],
+                xy[:, 1],
+                pen=_pen(color, 2),
+                brush=_brush(color),
+                size=10,
+                symbol="o"
+            )
+            scatter.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+            self._plot_widget.addItem(scatter)
+            self._point_scatters[color] = scatter
         
-        self._plot_widget.addItem(scatter)
-        self._plot_items[point.id] = scatter
+        self._stale_point_colors.clear()
 
     def _render_polyline(self, polyline: PolylineData2D):
         """
@@ -142,38 +250,23 @@ class Canvas2DQWidget(QWidget):
 
         :param polyline: Polyline data to render
         """
-        log.d(f"Rendering polyline {polyline.id} with {len(polyline.points)} points")
+        # Coordinate arrays are handed to PyQtGraph without per-point conversion
+        x_data, y_data = polyline.xy_arrays()
         
-        # Extract x and y coordinates
-        x_data, y_data = zip(*[(p.x, p.y) for p in polyline.points])
+        if DEBUG:
+            log.d(f"Rendering polyline {polyline.id} with {len(x_data)} points")
         
-        if len(polyline.points) >= 2:
-            # Create plot item for polyline (line connecting points)
-            plot_item = pg.PlotDataItem(
-                x_data,
-                y_data,
-                pen=pg.mkPen(color=polyline.color, width=2),
-                symbol="o",
-                symbolBrush=pg.mkBrush(color=polyline.color),
-                symbolSize=6
-            )
-            
-            self._plot_widget.addItem(plot_item)
-            self._plot_items[polyline.id] = plot_item
+        if len(x_data) == 0:
+            # Nothing to show for an empty polyline
+            self._remove_item(polyline.id)
+            return
+        
+        if len(x_data) >= 2:
+            # Show a plot item for the polyline (line connecting points)
+            self._show_curve(polyline.id, x_data, y_data, polyline.color)
         else:
             # If less than 2 points, just show the points as scatter
-            if len(polyline.points) > 0:
-                scatter = pg.ScatterPlotItem(
-                    x_data,
-                    y_data,
-                    pen=pg.mkPen(color=polyline.color, width=2),
-                    brush=pg.mkBrush(color=polyline.color),
-                    size=6,
-                    symbol="o"
-                )
-                
-                self._plot_widget.addItem(scatter)
-                self._plot_items[polyline.id] = scatter
+            self._show_scatter(polyline.id, x_data, y_data, polyline.color, size=6)
 
     def _render_polygon(self, polygon: PolygonData2D):
         """
@@ -181,47 +274,140 @@ class Canvas2DQWidget(QWidget):
 
         :param polygon: Polygon data to render
         """
-        log.d(f"Rendering polygon {polygon.id} with {len(polygon.points)} points")
+        # Closed ring arrays are handed to PyQtGraph without per-point conversion
+        x_data, y_data = polygon.xy_arrays()
         
-        # Extract x and y coordinates
-        x_data, y_data = zip(*[(p.x, p.y) for p in polygon.points])
+        if DEBUG:
+            log.d(f"Rendering polygon {polygon.id} with {len(x_data)} points")
         
-        if len(polygon.points) >= 3:
-            # Remove duplicate closing point for display (if present)
-            if len(x_data) > 1 and x_data[0] == x_data[-1] and y_data[0] == y_data[-1]:
-                x_display = x_data[:-1]
-                y_display = y_data[:-1]
-            else:
-                x_display = x_data
-                y_display = y_data
-            
+        if len(x_data) == 0:
+            # Nothing to show for an empty polygon
+            self._remove_item(polygon.id)
+            return
+        
+        if len(x_data) >= 3:
+            # The arrays already form a closed ring, so they are passed through as is
             # Use PlotDataItem with connect='all' to create closed polygon outline
-            plot_item = pg.PlotDataItem(
-                x_display + [x_display[0]] if len(x_display) > 0 else [],  # Ensure closed
-                y_display + [y_display[0]] if len(y_display) > 0 else [],  # Ensure closed
-                pen=pg.mkPen(color=polygon.color, width=2),
-                symbol="o",
-                symbolBrush=pg.mkBrush(color=polygon.color),
-                symbolSize=6,
-                connect="all"  # Connect all points to close the polygon
-            )
-            
-            self._plot_widget.addItem(plot_item)
-            self._plot_items[polygon.id] = plot_item
+            self._show_curve(polygon.id, x_data, y_data, polygon.color, connect="all")
         else:
             # If less than 3 points, just show the points as scatter
-            if len(polygon.points) > 0:
-                scatter = pg.ScatterPlotItem(
-                    x_data,
-                    y_data,
-                    pen=pg.mkPen(color=polygon.color, width=2),
-                    brush=pg.mkBrush(color=polygon.color),
-                    size=6,
-                    symbol="o"
-                )
-                
-                self._plot_widget.addItem(scatter)
-                self._plot_items[polygon.id] = scatter
+            self._show_scatter(polygon.id, x_data, y_data, polygon.color, size=6)
+
+    def _show_scatter(self, plot_id: str, x_data, y_data, color: str, size: int):
+        """
+        Show points as a scatter item, reusing the plot's existing scatter item if it has one.
+
+        :param plot_id: ID of the plot the item belongs to
+        :param x_data: X coordinates
+        :param y_data: Y coordinates
+        :param color: Color string
+        :param size: Symbol size in pixels
+        """
+        item = self._plot_items.get(plot_id)
+        if type(item) is pg.ScatterPlotItem:
+            if self._item_colors[plot_id] == color:
+                item.setData(x=x_data, y=y_data)
+            else:
+                item.setData(x=x_data, y=y_data, pen=_pen(color, 2), brush=_brush(color))
+                self._item_colors[plot_id] = color
+            return
+        
+        self._remove_item(plot_id)
+        scatter = pg.ScatterPlotItem(
+            x_data,
+            y_data,
+            pen=_pen(color, 2),
+            brush=_brush(color),
+            size=size,
+            symbol="o"
+        )
+        
+        self._plot_widget.addItem(scatter)
+        self._plot_items[plot_id] = scatter
+        self._apply_cache_mode(plot_id, scatter)
+        self._item_colors[plot_id] = color
+
+    def _show_curve(self, plot_id: str, x_data, y_data, color: str, connect: str = "auto"):
+        """
+        Show connected points as a plot data item, reusing the plot's existing one if it has one.
+
+        :param plot_id: ID of the plot the item belongs to
+        :param x_data: X coordinates
+        :param y_data: Y coordinates
+        :param color: Color string
+        :param connect: How to connect the points (default: 'auto')
+        """
+        item = self._plot_items.get(plot_id)
+        if type(item) is pg.PlotDataItem:
+            if self._item_colors[plot_id] == color:
+                item.setData(x_data, y_data)
+            else:
+                item.setData(x_data, y_data, pen=_pen(color, 2), symbolBrush=_brush(color))
+                self._item_colors[plot_id] = color
+            return
+        
+        self._remove_item(plot_id)
+        plot_item = pg.PlotDataItem(
+            x_data,
+            y_data,
+            pen=_pen(color, 2),
+            symbol="o",
+            symbolBrush=_brush(color),
+            symbolSize=6,
+            connect=connect
+        )
+        
+        self._plot_widget.addItem(plot_item)
+        self._plot_items[plot_id] = plot_item
+        self._apply_cache_mode(plot_id, plot_item)
+        self._item_colors[plot_id] = color
+
+    def _apply_cache_mode(self, plot_id: str, item: pg.GraphicsObject):
+        """
+        Cache the rasterized item so panning blits a pixmap instead of repainting it.
+
+        The plot being edited is left uncached, as each edit would invalidate the cache.
+
+        :param plot_id: ID of the plot the item belongs to
+        :param item: Plot item to configure
+        """
+        if plot_id == self._editing_plot_id:
+            cache_mode = QGraphicsItem.CacheMode.NoCache
+        else:
+            cache_mode = QGraphicsItem.CacheMode.DeviceCoordinateCache
+        
+        # A PlotDataItem only groups its curve and scatter children, which do the painting
+        if isinstance(item, pg.PlotDataItem):
+            item.curve.setCacheMode(cache_mode)
+            item.scatter.setCacheMode(cache_mode)
+        else:
+            item.setCacheMode(cache_mode)
+
+    def _refresh_cache_modes(self):
+        """Update item caching when the user switches to editing another plot."""
+        editing_plot_id = self._view_model.current_plot_id
+        previous_plot_id = self._editing_plot_id
+        if editing_plot_id == previous_plot_id:
+            return
+        
+        self._editing_plot_id = editing_plot_id
+        for plot_id in (previous_plot_id, editing_plot_id):
+            item = self._plot_items.get(plot_id)
+            if item is not None:
+                self._apply_cache_mode(plot_id, item)
+
+    def _remove_item(self, plot_id: str):
+        """
+        Remove the plot item for a plot, if it has one.
+
+        :param plot_id: ID of the plot
+        """
+        item = self._plot_items.pop(plot_id, None)
+        if item is not None:
+            del self._item_colors[plot_id]
+            if DEBUG:
+                log.d(f"Removing plot item {plot_id}")
+            self._plot_widget.removeItem(item)
 
     @property
     def view_model(self) -> Canvas2DQViewModel:
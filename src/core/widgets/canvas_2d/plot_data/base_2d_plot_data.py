@@ -1,8 +1,10 @@
 """Base class for 2D plot data."""
 
-from abc import ABC
+from abc import ABC, abstractmethod
+from typing import Callable
 
 from .plot_data_2d_enum import PlotData2D
+from src.core.debug import DEBUG
 from src.util.logger import Logger
 
 
@@ -11,6 +13,8 @@ log = Logger(__name__)
 class Base2DPlotData(ABC):
     """Base class for all 2D plot data types."""
 
+    __slots__ = ("_id", "_color", "_type", "_update", "_update_listener")
+
     def __init__(self, id: str, color: str, type: PlotData2D, update: bool = True):
         """
         Initialize base plot data.
@@ -24,8 +28,10 @@ class Base2DPlotData(ABC):
         self._color = color
         self._type = type
         self._update = update
+        self._update_listener: Callable[[str], None] | None = None
         
-        log.d(f"Created {type.value} plot data with id: {id}")
+        if DEBUG:
+            log.d(f"Created {type.value} plot data with id: {id}")
 
     @property
     def id(self) -> str:
@@ -35,9 +41,10 @@ class Base2DPlotData(ABC):
     @id.setter
     def id(self, value: str):
         """Set the unique identifier."""
-        log.d(f"Setting id from {self._id} to {value}")
+        if DEBUG:
+            log.d(f"Setting id from {self._id} to {value}")
         self._id = value
-        self._update = True
+        self._mark_updated()
 
     @property
     def color(self) -> str:
@@ -47,9 +54,10 @@ class Base2DPlotData(ABC):
     @color.setter
     def color(self, value: str):
         """Set the color."""
-        log.d(f"Setting color from {self._color} to {value}")
+        if DEBUG:
+            log.d(f"Setting color from {self._color} to {value}")
         self._color = value
-        self._update = True
+        self._mark_updated()
 
     @property
     def type(self) -> PlotData2D:
@@ -64,4 +72,29 @@ class Base2DPlotData(ABC):
     @update.setter
     def update(self, value: bool):
         """Set the update flag."""
-        self._update = value
+        if value:
+            self._mark_updated()
+        else:
+            self._update = False
+
+    @abstractmethod
+    def copy(self) -> "Base2DPlotData":
+        """
+        Create an independent copy of the plot data, not flagged for update.
+
+        :return: New plot data instance with the same data
+        """
+
+    def set_update_listener(self, listener: Callable[[str], None] | None):
+        """
+        Set the callback notified with this plot's ID whenever it needs to be updated.
+
+        :param listener: Callback taking the plot ID, or None to remove it
+        """
+        self._update_listener = listener
+
+    def _mark_updated(self):
+        """Flag this plot as needing an update and notify the listener."""
+        self._update = True
+        if self._update_listener is not None:
+            self._update_listener(self._id)
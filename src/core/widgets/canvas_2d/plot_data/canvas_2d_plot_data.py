@@ -1,16 +1,15 @@
 """Canvas plot data container for managing all 2D plots."""
 
-from typing import Dict, List
+from collections import deque
+from typing import Deque, Dict, KeysView, List, Set
 
 from PySide6.QtCore import QObject, Signal
 
+from src.core.debug import DEBUG
 from src.util.logger import Logger
 
 from .base_2d_plot_data import Base2DPlotData
-from .point_data_2d import PointData2D
-from .polygon_data_2d import PolygonData2D
-from .polyline_data_2d import PolylineData2D
-from .plot_data_2d_enum import PlotData2D
+from .undo_commands import SnapshotCmd, UndoCommand
 
 
 class Canvas2DPlotData(QObject):
@@ -23,8 +22,14 @@ class Canvas2DPlotData(QObject):
         """Initialize the canvas plot data container."""
         super().__init__()
         self._plots: Dict[str, Base2DPlotData] = {}
-        self._undo_stack: List[Dict[str, Base2DPlotData]] = []
-        self._redo_stack: List[Dict[str, Base2DPlotData]] = []
+        # Bounded stacks; the oldest entry is discarded once the limit is reached
+        self._undo_stack: Deque[UndoCommand] = deque(maxlen=100)
+        self._redo_stack: Deque[UndoCommand] = deque(maxlen=100)
+        self._dirty_ids: Set[str] = set()
+        # IDs of plots removed since the last mark_all_updated call
+        self._removed_ids: Set[str] = set()
+        # Incremented on every change, so derived data can be cached until the plots change
+        self._revision = 0
         self._logger = Logger(self.__class__.__name__)
         self._logger.d("Initialized Canvas2DPlotData")
 
@@ -34,11 +39,13 @@ class Canvas2DPlotData(QObject):
 
         :param plot: Plot data to add
         """
-        self._logger.d(f"Adding plot {plot.id} of type {plot.type.value}")
+        if DEBUG:
+            self._logger.d(f"Adding plot {plot.id} of type {plot.type.value}")
         self._save_state_for_undo()
         self._plots[plot.id] = plot
+        plot.set_update_listener(self._on_plot_updated)
+        # Marking the plot for update emits data_changed
         plot.update = True
-        self.data_changed.emit()
 
     def remove_plot(self, plot_id: str) -> bool:
         """
@@ -48,14 +55,52 @@ class Canvas2DPlotData(QObject):
         :return: True if plot was removed, False otherwise
         """
         if plot_id in self._plots:
-            self._logger.d(f"Removing plot {plot_id}")
+            if DEBUG:
+                self._logger.d(f"Removing plot {plot_id}")
             self._save_state_for_undo()
             del self._plots[plot_id]
+            self._removed_ids.add(plot_id)
+            self._revision += 1
             self.data_changed.emit()
             return True
         self._logger.w(f"Plot {plot_id} not found")
         return False
 
+    @property
+    def dirty_ids(self) -> Set[str]:
+        """Get the IDs of plots that changed since the last mark_all_updated call."""
+        return self._dirty_ids
+
+    @property
+    def removed_ids(self) -> Set[str]:
+        """
+        Get the IDs of plots removed since the last mark_all_updated call.
+
+        A removed plot may have been restored since (e.g. by undo), so callers
+        should check the ID against get_plot_ids before dropping its item.
+        """
+        return self._removed_ids
+
+    @property
+    def revision(self) -> int:
+        """Get a counter that changes whenever any plot is added, removed or modified."""
+        return self._revision
+
+    def _on_plot_updated(self, plot_id: str):
+        """
+        Record a plot as needing an update.
+
+        data_changed is only emitted when the first plot becomes dirty; further
+        changes are picked up by the update already requested.
+
+        :param plot_id: ID of the plot that changed
+        """
+        self._revision += 1
+        was_clean = not self._dirty_ids
+        self._dirty_ids.add(plot_id)
+        if was_clean:
+            self.data_changed.emit()
+
     def get_plot(self, plot_id: str) -> Base2DPlotData | None:
         """
         Get a plot by its ID.
@@ -73,59 +118,96 @@ class Canvas2DPlotData(QObject):
         """
         return list(self._plots.values())
 
+    def get_plot_ids(self) -> KeysView[str]:
+        """
+        Get the IDs of all plots.
+
+        :return: Live view of the plot IDs
+        """
+        return self._plots.keys()
+
     def get_plots_to_update(self) -> List[Base2DPlotData]:
         """
         Get all plots that need to be updated (update == True).
 
+        Only the dirty set is consulted, so this is O(changed plots) rather than O(all plots).
+
         :return: List of plot data that needs updating
         """
-        plots_to_update = [plot for plot in self._plots.values() if plot.update]
-        self._logger.d(f"Found {len(plots_to_update)} plots to update")
+        plots = self._plots
+        plots_to_update = [plots[plot_id] for plot_id in self._dirty_ids if plot_id in plots]
+        if DEBUG:
+            self._logger.d(f"Found {len(plots_to_update)} plots to update")
         return plots_to_update
 
     def mark_all_updated(self):
-        """Mark all plots as updated (set update flag to False)."""
-        for plot in self._plots.values():
-            plot.update = False
+        """Mark all plots as updated (set update flag to False) and forget the removed plots."""
+        # Only plots in the dirty set can have their update flag set
+        plots = self._plots
+        for plot_id in self._dirty_ids:
+            plot = plots.get(plot_id)
+            if plot is not None:
+                plot.update = False
+        self._dirty_ids.clear()
+        self._removed_ids.clear()
 
     def save_state_for_undo(self):
         """
         Save current state for undo functionality.
         
         This is a public method that can be called before making changes
-        that should be undoable.
+        that should be undoable. Since the caller may then modify plots in
+        place, every plot is copied. Point-level edits should prefer push_undo
+        with a command, which avoids copying every plot.
         """
-        self._save_state_for_undo()
-
-    def _save_state_for_undo(self):
-        """Save current state for undo functionality."""
-        # Deep copy the current state
-        state_copy = {}
-        for plot_id, plot in self._plots.items():
-            if isinstance(plot, PointData2D):
-                state_copy[plot_id] = PointData2D(
-                    plot.id, plot.x, plot.y, plot.color, plot.deletable, False
-                )
-            elif isinstance(plot, PolylineData2D):
-                points_copy = [
-                    PointData2D(p.id, p.x, p.y, p.color, p.deletable, False)
-                    for p in plot.points
-                ]
-                state_copy[plot_id] = PolylineData2D(plot.id, points_copy, plot.color, False)
-            elif isinstance(plot, PolygonData2D):
-                points_copy = [
-                    PointData2D(p.id, p.x, p.y, p.color, p.deletable, False)
-                    for p in plot.points
-                ]
-                state_copy[plot_id] = PolygonData2D(plot.id, points_copy, plot.color, False)
+        # Copy the current state; each plot copies its vertex arrays in bulk
+        state_copy = {plot_id: plot.copy() for plot_id, plot in self._plots.items()}
         
-        self._undo_stack.append(state_copy)
-        # Limit undo stack size
-        if len(self._undo_stack) > 100:
-            self._undo_stack.pop(0)
+        self.push_undo(SnapshotCmd(state_copy))
+
+    def push_undo(self, command: UndoCommand):
+        """
+        Record an already-applied change for undo functionality.
+
+        :param command: Command describing the change
+        """
+        self._undo_stack.append(command)
         # Clear redo stack when new action is performed
         self._redo_stack.clear()
-        self._logger.d(f"Saved state for undo. Stack size: {len(self._undo_stack)}")
+        if DEBUG:
+            self._logger.d(f"Saved state for undo. Stack size: {len(self._undo_stack)}")
+
+    def _save_state_for_undo(self):
+        """
+        Save current state for undo functionality before a structural change.
+
+        Only the plot dict is copied; the plot objects are shared with the live
+        state. This is safe because edits to existing plots are recorded as undo
+        commands, which are always reverted before this snapshot is restored.
+        """
+        self.push_undo(SnapshotCmd(dict(self._plots)))
+
+    def _swap_plots(self, plots: Dict[str, Base2DPlotData]) -> Dict[str, Base2DPlotData]:
+        """
+        Replace the live plots with the given ones and mark the changed ones for update.
+
+        A plot object present in both states is unchanged, since edits to existing
+        plots are always reverted by their own undo commands before a snapshot is
+        swapped back. Only plots that were added, removed or replaced are updated.
+
+        :param plots: Plots to make live
+        :return: The previously live plots
+        """
+        previous = self._plots
+        self._plots = plots
+        self._removed_ids.update(previous.keys() - plots.keys())
+        self._revision += 1
+        # Mark only the plots that differ from the previous state as needing update
+        for plot_id, plot in plots.items():
+            if previous.get(plot_id) is not plot:
+                plot.set_update_listener(self._on_plot_updated)
+                plot.update = True
+        return previous
 
     def undo(self) -> bool:
         """
@@ -138,35 +220,12 @@ class Canvas2DPlotData(QObject):
             return False
         
         self._logger.d("Performing undo")
-        # Save current state to redo stack
-        current_state = {}
-        for plot_id, plot in self._plots.items():
-            if isinstance(plot, PointData2D):
-                current_state[plot_id] = PointData2D(
-                    plot.id, plot.x, plot.y, plot.color, plot.deletable, False
-                )
-            elif isinstance(plot, PolylineData2D):
-                points_copy = [
-                    PointData2D(p.id, p.x, p.y, p.color, p.deletable, False)
-                    for p in plot.points
-                ]
-                current_state[plot_id] = PolylineData2D(plot.id, points_copy, plot.color, False)
-            elif isinstance(plot, PolygonData2D):
-                points_copy = [
-                    PointData2D(p.id, p.x, p.y, p.color, p.deletable, False)
-                    for p in plot.points
-                ]
-                current_state[plot_id] = PolygonData2D(plot.id, points_copy, plot.color, False)
-        
-        self._redo_stack.append(current_state)
-        
-        # Restore previous state
-        previous_state = self._undo_stack.pop()
-        self._plots = previous_state
-        # Mark all restored plots as needing update
-        for plot in self._plots.values():
-            plot.update = True
-        self.data_changed.emit()
+        command = self._undo_stack.pop()
+        command.revert(self)
+        self._redo_stack.append(command)
+        # Plots touched by the command have already requested an update
+        if not self._dirty_ids:
+            self.data_changed.emit()
         return True
 
     def redo(self) -> bool:
@@ -180,40 +239,19 @@ class Canvas2DPlotData(QObject):
             return False
         
         self._logger.d("Performing redo")
-        # Save current state to undo stack
-        current_state = {}
-        for plot_id, plot in self._plots.items():
-            if isinstance(plot, PointData2D):
-                current_state[plot_id] = PointData2D(
-                    plot.id, plot.x, plot.y, plot.color, plot.deletable, False
-                )
-            elif isinstance(plot, PolylineData2D):
-                points_copy = [
-                    PointData2D(p.id, p.x, p.y, p.color, p.deletable, False)
-                    for p in plot.points
-                ]
-                current_state[plot_id] = PolylineData2D(plot.id, points_copy, plot.color, False)
-            elif isinstance(plot, PolygonData2D):
-                points_copy = [
-                    PointData2D(p.id, p.x, p.y, p.color, p.deletable, False)
-                    for p in plot.points
-                ]
-                current_state[plot_id] = PolygonData2D(plot.id, points_copy, plot.color, False)
-        
-        self._undo_stack.append(current_state)
-        
-        # Restore next state
-        next_state = self._redo_stack.pop()
-        self._plots = next_state
-        # Mark all restored plots as needing update
-        for plot in self._plots.values():
-            plot.update = True
-        self.data_changed.emit()
+        command = self._redo_stack.pop()
+        command.apply(self)
+        self._undo_stack.append(command)
+        # Plots touched by the command have already requested an update
+        if not self._dirty_ids:
+            self.data_changed.emit()
         return True
 
     def clear(self):
         """Clear all plots from the canvas."""
         self._logger.d("Clearing all plots")
         self._save_state_for_undo()
+        self._removed_ids.update(self._plots)
         self._plots.clear()
+        self._revision += 1
         self.data_changed.emit()
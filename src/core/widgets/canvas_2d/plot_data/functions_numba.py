@@ -0,0 +1,51 @@
+"""Optional Numba kernels for the vertex buffer hot paths."""
+
+import numpy as np
+import pyqtgraph as pg
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def enabled() -> bool:
+    """
+    Check whether the Numba kernels should be used.
+
+    Follows PyQtGraph's useNumba config option, so Numba stays an optional dependency.
+
+    :return: True if Numba is installed and enabled, False otherwise
+    """
+    return numba is not None and pg.getConfigOption("useNumba")
+
+
+def _nearest_deletable(xs: np.ndarray, ys: np.ndarray, deletable: np.ndarray, n: int, cx: float, cy: float):
+    """
+    Find the nearest deletable vertex in a single pass, without temporary arrays.
+
+    :param xs: X coordinates
+    :param ys: Y coordinates
+    :param deletable: Deletable flags
+    :param n: Number of vertices to scan
+    :param cx: X coordinate to search around
+    :param cy: Y coordinate to search around
+    :return: Tuple of (index, squared distance), index is -1 if no vertex is deletable
+    """
+    best_index = -1
+    best_d2 = np.inf
+    for i in range(n):
+        if deletable[i]:
+            dx = xs[i] - cx
+            dy = ys[i] - cy
+            d2 = dx * dx + dy * dy
+            if d2 < best_d2:
+                best_index = i
+                best_d2 = d2
+    return best_index, best_d2
+
+
+if numba is not None:
+    nearest_deletable = numba.njit(cache=True)(_nearest_deletable)
+else:
+    nearest_deletable = _nearest_deletable
@@ -1,5 +1,10 @@
 """Point data for 2D plotting."""
 
+import math
+
+import numpy as np
+
+from src.core.debug import DEBUG
 from src.util.logger import Logger
 from .base_2d_plot_data import Base2DPlotData
 from .plot_data_2d_enum import PlotData2D
@@ -10,6 +15,8 @@ log = Logger(__name__)
 class PointData2D(Base2DPlotData):
     """Represents a single point in 2D space."""
 
+    __slots__ = ("_x", "_y", "_deletable")
+
     def __init__(self, id: str, x: float, y: float, color: str = "r", deletable: bool = True, update: bool = True):
         """
         Initialize a 2D point.
@@ -26,7 +33,8 @@ class PointData2D(Base2DPlotData):
         self._y = y
         self._deletable = deletable
         
-        log.d(f"Created point at ({x}, {y}) with id: {id}, deletable: {deletable}")
+        if DEBUG:
+            log.d(f"Created point at ({x}, {y}) with id: {id}, deletable: {deletable}")
 
     @property
     def x(self) -> float:
@@ -36,9 +44,10 @@ class PointData2D(Base2DPlotData):
     @x.setter
     def x(self, value: float):
         """Set the X coordinate."""
-        log.d(f"Setting x from {self._x} to {value}")
+        if DEBUG:
+            log.d(f"Setting x from {self._x} to {value}")
         self._x = value
-        self._update = True
+        self._mark_updated()
 
     @property
     def y(self) -> float:
@@ -48,9 +57,10 @@ class PointData2D(Base2DPlotData):
     @y.setter
     def y(self, value: float):
         """Set the Y coordinate."""
-        log.d(f"Setting y from {self._y} to {value}")
+        if DEBUG:
+            log.d(f"Setting y from {self._y} to {value}")
         self._y = value
-        self._update = True
+        self._mark_updated()
 
     @property
     def deletable(self) -> bool:
@@ -60,9 +70,18 @@ class PointData2D(Base2DPlotData):
     @deletable.setter
     def deletable(self, value: bool):
         """Set whether this point can be deleted."""
-        log.d(f"Setting deletable from {self._deletable} to {value}")
+        if DEBUG:
+            log.d(f"Setting deletable from {self._deletable} to {value}")
         self._deletable = value
 
+    def copy(self) -> "PointData2D":
+        """
+        Create an independent copy of the point, not flagged for update.
+
+        :return: New PointData2D with the same data
+        """
+        return PointData2D(self._id, self._x, self._y, self._color, self._deletable, False)
+
     def distance_to(self, x: float, y: float) -> float:
         """
         Calculate Euclidean distance to another point.
@@ -71,4 +90,31 @@ class PointData2D(Base2DPlotData):
         :param y: Y coordinate of the other point
         :return: Euclidean distance
         """
-        return ((self._x - x) ** 2 + (self._y - y) ** 2) ** 0.5
+        return math.hypot(self._x - x, self._y - y)
+
+    @classmethod
+    def distance_to_many(cls, xs: np.ndarray, ys: np.ndarray, x: float, y: float) -> np.ndarray:
+        """
+        Calculate Euclidean distances from many points to one position in a single vectorized call.
+
+        :param xs: X coordinates of the points
+        :param ys: Y coordinates of the points
+        :param x: X coordinate of the position
+        :param y: Y coordinate of the position
+        :return: Array of distances, one per point
+        """
+        return np.hypot(xs - x, ys - y)
+
+    def distance2_to(self, x: float, y: float) -> float:
+        """
+        Calculate the squared Euclidean distance to another point.
+
+        Cheaper than distance_to when only comparing against a threshold.
+
+        :param x: X coordinate of the other point
+        :param y: Y coordinate of the other point
+        :return: Squared Euclidean distance
+        """
+        dx = self._x - x
+        dy = self._y - y
+        return dx * dx + dy * dy
@@ -2,18 +2,18 @@
 
 from typing import List
 
-from src.util.logger import Logger
+import numpy as np
 
-from .base_2d_plot_data import Base2DPlotData
 from .plot_data_2d_enum import PlotData2D
 from .point_data_2d import PointData2D
+from .vertex_plot_data_2d import VertexPlotData2D
 
 
-log = Logger(__name__)
-
-class PolygonData2D(Base2DPlotData):
+class PolygonData2D(VertexPlotData2D):
     """Represents a polygon (closed shape) in 2D space."""
 
+    __slots__ = ()
+
     def __init__(self, id: str, points: List[PointData2D] | None = None, color: str = "g", update: bool = True):
         """
         Initialize a 2D polygon.
@@ -23,118 +23,34 @@ class PolygonData2D(Base2DPlotData):
         :param color: Color string (default: 'g')
         :param update: Whether this polygon needs to be updated in the UI (default: True)
         """
-        super().__init__(id, color, PlotData2D.POLYGON, update)
-        self._points: List[PointData2D] = points if points is not None else []
-        self._closed = False
-        
-        log.d(f"Created polygon with id: {id}, {len(self._points)} points")
-        
-        # Auto-close if we have 3 or more points
-        if len(self._points) >= 3:
-            self._ensure_closed()
-
-    @property
-    def points(self) -> List[PointData2D]:
-        """Get the list of points."""
-        return self._points
+        super().__init__(id, points, color, PlotData2D.POLYGON, update)
 
     @property
     def closed(self) -> bool:
-        """Get whether the polygon is closed."""
-        return self._closed
+        """Get whether the polygon is closed (has 3 or more points)."""
+        return len(self._buffer) >= 3
 
-    def _ensure_closed(self):
-        """Ensure the polygon is closed by adding the first point at the end if needed."""
-        if len(self._points) >= 3 and not self._closed:
-            # Check if the last point is the same as the first
-            first_point = self._points[0]
-            last_point = self._points[-1]
-            
-            if first_point.x != last_point.x or first_point.y != last_point.y:
-                # Create a copy of the first point to close the ring
-                closing_point = PointData2D(
-                    id=f"{first_point.id}_close",
-                    x=first_point.x,
-                    y=first_point.y,
-                    color=first_point.color,
-                    deletable=False,
-                    update=True
-                )
-                log.d(f"Auto-closing polygon {self._id} by adding closing point")
-                self._points.append(closing_point)
-            
-            self._closed = True
-
-    def add_point(self, point: PointData2D):
+    def xy_arrays(self) -> tuple[np.ndarray, np.ndarray]:
         """
-        Add a point to the polygon.
-        
-        If the polygon is closed (has 3+ points), new points are inserted
-        at the second-last position (before the closing point).
+        Get the point coordinates as arrays, repeating the first point at the end once closed.
 
-        :param point: Point to add
-        """
-        if self._closed and len(self._points) >= 3:
-            # Insert at second-last position (before the closing point)
-            insert_index = len(self._points) - 1
-            log.d(f"Inserting point {point.id} at position {insert_index} in closed polygon {self._id}")
-            self._points.insert(insert_index, point)
-        else:
-            log.d(f"Adding point {point.id} to polygon {self._id}")
-            self._points.append(point)
-            
-            # Auto-close when we reach 3 points
-            if len(self._points) >= 3:
-                self._ensure_closed()
-        
-        self._update = True
+        The closing point is not stored as a vertex; it is appended to new
+        arrays, which do not change when the polygon is later modified.
 
-    def remove_point(self, point_id: str) -> bool:
+        :return: Tuple of (x, y) coordinate arrays
         """
-        Remove a point from the polygon by its ID.
-        
-        If removing a point causes the polygon to have less than 3 points,
-        it will be unclosed.
+        xs, ys = self._buffer.xs, self._buffer.ys
+        if self.closed:
+            return np.concatenate((xs, xs[:1])), np.concatenate((ys, ys[:1]))
+        return xs.copy(), ys.copy()
 
-        :param point_id: ID of the point to remove
-        :return: True if point was removed, False otherwise
+    def _is_removable(self, index: int) -> bool:
         """
-        for i, point in enumerate(self._points):
-            if point.id == point_id:
-                # Don't allow deletion of closing point directly
-                if not point.deletable:
-                    log.w(f"Cannot delete non-deletable point {point_id} from polygon {self._id}")
-                    return False
-                
-                log.d(f"Removing point {point_id} from polygon {self._id}")
-                del self._points[i]
-                
-                # If we have less than 3 points, unclose the polygon
-                if len(self._points) < 3:
-                    self._closed = False
-                    # Remove closing point if it exists
-                    if len(self._points) > 0:
-                        last_point = self._points[-1]
-                        if last_point.id.endswith("_close"):
-                            self._points.pop()
-                else:
-                    # Re-ensure closure after removal
-                    self._ensure_closed()
-                
-                self._update = True
-                return True
-        
-        log.w(f"Point {point_id} not found in polygon {self._id}")
-        return False
+        Check whether the point at the given index may be removed.
 
-    def get_point_by_id(self, point_id: str) -> PointData2D | None:
-        """
-        Get a point by its ID.
+        Non-deletable points of a polygon are kept by remove_point and remove_points.
 
-        :param point_id: ID of the point
-        :return: PointData2D if found, None otherwise
+        :param index: Index of the point
+        :return: True if the point is deletable, False otherwise
         """
-        for point in self._points:
-            if point.id == point_id:
-                return point
-        return None
+        return self._buffer.vertex(index)[3]
\ No newline at end of file
@@ -0,0 +1,138 @@
+"""Undo commands for 2D canvas plot data."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Dict, List
+
+import numpy as np
+
+from .base_2d_plot_data import Base2DPlotData
+from .point_data_2d import PointData2D
+
+if TYPE_CHECKING:
+    from .canvas_2d_plot_data import Canvas2DPlotData
+
+
+class UndoCommand(ABC):
+    """A reversible change to the canvas plot data."""
+
+    @abstractmethod
+    def apply(self, plot_data: Canvas2DPlotData):
+        """
+        Apply (or re-apply) the change.
+
+        :param plot_data: Plot data container to modify
+        """
+
+    @abstractmethod
+    def revert(self, plot_data: Canvas2DPlotData):
+        """
+        Revert the change.
+
+        :param plot_data: Plot data container to modify
+        """
+
+
+class AddPointCmd(UndoCommand):
+    """Addition of a point to the end of a polyline or polygon."""
+
+    def __init__(self, plot_id: str, point_id: str, x: float, y: float):
+        """
+        Initialize the command.
+
+        :param plot_id: ID of the polyline or polygon
+        :param point_id: ID of the point that was added
+        :param x: X coordinate of the point
+        :param y: Y coordinate of the point
+        """
+        self._plot_id = plot_id
+        self._point_id = point_id
+        self._x = x
+        self._y = y
+
+    def apply(self, plot_data: Canvas2DPlotData):
+        """Add the point again."""
+        plot_data.get_plot(self._plot_id).add_point(self._point_id, self._x, self._y)
+
+    def revert(self, plot_data: Canvas2DPlotData):
+        """Remove the added point."""
+        plot_data.get_plot(self._plot_id).remove_point(self._point_id)
+
+
+class AddPointsCmd(UndoCommand):
+    """Addition of a block of points to the end of a polyline or polygon."""
+
+    def __init__(self, plot_id: str, point_ids: List[str], xs: np.ndarray, ys: np.ndarray):
+        """
+        Initialize the command.
+
+        :param plot_id: ID of the polyline or polygon
+        :param point_ids: IDs of the points that were added
+        :param xs: X coordinates of the points
+        :param ys: Y coordinates of the points
+        """
+        self._plot_id = plot_id
+        self._point_ids = point_ids
+        self._xs = xs
+        self._ys = ys
+
+    def apply(self, plot_data: Canvas2DPlotData):
+        """Add the points again."""
+        plot_data.get_plot(self._plot_id).add_points(self._point_ids, self._xs, self._ys)
+
+    def revert(self, plot_data: Canvas2DPlotData):
+        """Remove the added points."""
+        plot_data.get_plot(self._plot_id).remove_points(self._point_ids)
+
+
+class RemovePointCmd(UndoCommand):
+    """Removal of a point from a polyline or polygon."""
+
+    def __init__(self, plot_id: str, point: PointData2D, index: int):
+        """
+        Initialize the command.
+
+        :param plot_id: ID of the polyline or polygon
+        :param point: Point that was removed
+        :param index: Index the point had before removal
+        """
+        self._plot_id = plot_id
+        self._point = point
+        self._index = index
+
+    def apply(self, plot_data: Canvas2DPlotData):
+        """Remove the point again."""
+        plot_data.get_plot(self._plot_id).remove_point(self._point.id)
+
+    def revert(self, plot_data: Canvas2DPlotData):
+        """Put the point back at its original index."""
+        point = self._point
+        plot_data.get_plot(self._plot_id).insert_point(
+            self._index, point.id, point.x, point.y, point.deletable
+        )
+
+
+class SnapshotCmd(UndoCommand):
+    """
+    Fallback for structural changes (adding, removing or clearing plots).
+
+    Holds a copy of the plots taken before the change. Reverting and
+    re-applying swap it with the live plots, so no further copies are made.
+    """
+
+    def __init__(self, plots: Dict[str, Base2DPlotData]):
+        """
+        Initialize the command.
+
+        :param plots: Copy of the plots before the change
+        """
+        self._plots = plots
+
+    def apply(self, plot_data: Canvas2DPlotData):
+        """Swap the stored plots back in."""
+        self._plots = plot_data._swap_plots(self._plots)
+
+    def revert(self, plot_data: Canvas2DPlotData):
+        """Swap the stored plots back in."""
+        self._plots = plot_data._swap_plots(self._plots)
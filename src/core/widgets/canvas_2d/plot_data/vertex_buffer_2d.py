@@ -0,0 +1,328 @@
+"""Struct-of-arrays vertex storage for 2D plot data."""
+
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from . import functions_numba
+from .point_data_2d import PointData2D
+
+
+class VertexBuffer2D:
+    """Growable struct-of-arrays buffer holding vertex ids, coordinates and flags."""
+
+    __slots__ = ("_xs", "_ys", "_deletable", "_ids", "_id_to_index", "_n", "_bbox", "_bbox_dirty")
+
+    def __init__(self, capacity: int = 16):
+        """
+        Initialize an empty vertex buffer.
+
+        :param capacity: Initial number of vertices to allocate room for (default: 16)
+        """
+        capacity = max(capacity, 1)
+        self._xs = np.empty(capacity, dtype=np.float64)
+        self._ys = np.empty(capacity, dtype=np.float64)
+        self._deletable = np.empty(capacity, dtype=np.bool_)
+        self._ids: List[str] = []
+        self._id_to_index: Dict[str, int] = {}
+        self._n = 0
+        # Bounding box as [min_x, min_y, max_x, max_y], recomputed lazily after deletions
+        self._bbox = [np.inf, np.inf, -np.inf, -np.inf]
+        self._bbox_dirty = False
+
+    def __len__(self) -> int:
+        """Get the number of stored vertices."""
+        return self._n
+
+    @property
+    def ids(self) -> List[str]:
+        """Get the list of vertex ids."""
+        return self._ids
+
+    @property
+    def xs(self) -> np.ndarray:
+        """Get a view of the X coordinates."""
+        return self._xs[:self._n]
+
+    @property
+    def ys(self) -> np.ndarray:
+        """Get a view of the Y coordinates."""
+        return self._ys[:self._n]
+
+    def copy(self) -> "VertexBuffer2D":
+        """
+        Create an independent copy of the buffer, trimmed to the stored vertices.
+
+        :return: New VertexBuffer2D with the same vertices
+        """
+        n = self._n
+        clone = VertexBuffer2D(n)
+        clone._xs[:n] = self._xs[:n]
+        clone._ys[:n] = self._ys[:n]
+        clone._deletable[:n] = self._deletable[:n]
+        clone._ids = self._ids.copy()
+        clone._id_to_index = self._id_to_index.copy()
+        clone._n = n
+        clone._bbox = self._bbox.copy()
+        clone._bbox_dirty = self._bbox_dirty
+        return clone
+
+    def vertex(self, index: int) -> tuple[str, float, float, bool]:
+        """
+        Get the vertex at the given index.
+
+        :param index: Vertex index
+        :return: Tuple of (id, x, y, deletable)
+        """
+        return (
+            self._ids[index],
+            float(self._xs[index]),
+            float(self._ys[index]),
+            bool(self._deletable[index]),
+        )
+
+    def index_of(self, point_id: str) -> int | None:
+        """
+        Get the index of a vertex by its ID.
+
+        :param point_id: ID of the vertex
+        :return: Index of the vertex, or None if not found
+        """
+        return self._id_to_index.get(point_id)
+
+    def append(self, point_id: str, x: float, y: float, deletable: bool = True):
+        """
+        Append a vertex at the end of the buffer.
+
+        :param point_id: ID of the vertex
+        :param x: X coordinate
+        :param y: Y coordinate
+        :param deletable: Whether the vertex can be deleted (default: True)
+        """
+        n = self._n
+        if n == len(self._xs):
+            self._reserve(n + 1)
+        self._xs[n] = x
+        self._ys[n] = y
+        self._deletable[n] = deletable
+        self._ids.append(point_id)
+        self._id_to_index[point_id] = n
+        self._n = n + 1
+        self._widen_bbox(x, y)
+
+    def extend(self, point_ids: Sequence[str], xs: np.ndarray, ys: np.ndarray, deletable: bool = True):
+        """
+        Append a block of vertices at the end of the buffer, growing the arrays at most once.
+
+        :param point_ids: IDs of the vertices
+        :param xs: X coordinates
+        :param ys: Y coordinates
+        :param deletable: Whether the vertices can be deleted (default: True)
+        """
+        count = len(point_ids)
+        if count == 0:
+            return
+        n = self._n
+        if n + count > len(self._xs):
+            self._reserve(n + count)
+        self._xs[n:n + count] = xs
+        self._ys[n:n + count] = ys
+        self._deletable[n:n + count] = deletable
+        self._ids.extend(point_ids)
+        self._id_to_index.update(zip(point_ids, range(n, n + count)))
+        self._n = n + count
+        if not self._bbox_dirty:
+            bbox = self._bbox
+            bbox[0] = min(bbox[0], float(np.min(xs)))
+            bbox[1] = min(bbox[1], float(np.min(ys)))
+            bbox[2] = max(bbox[2], float(np.max(xs)))
+            bbox[3] = max(bbox[3], float(np.max(ys)))
+
+    def insert(self, index: int, point_id: str, x: float, y: float, deletable: bool = True):
+        """
+        Insert a vertex before the given index.
+
+        :param index: Index to insert at
+        :param point_id: ID of the vertex
+        :param x: X coordinate
+        :param y: Y coordinate
+        :param deletable: Whether the vertex can be deleted (default: True)
+        """
+        n = self._n
+        if n == len(self._xs):
+            self._reserve(n + 1)
+        for array in (self._xs, self._ys, self._deletable):
+            array[index + 1:n + 1] = array[index:n]
+        self._xs[index] = x
+        self._ys[index] = y
+        self._deletable[index] = deletable
+        self._ids.insert(index, point_id)
+        self._n = n + 1
+        self._reindex_from(index)
+        self._widen_bbox(x, y)
+
+    def delete(self, index: int):
+        """
+        Delete the vertex at the given index, keeping the order of the rest.
+
+        :param index: Index of the vertex to delete
+        """
+        n = self._n
+        for array in (self._xs, self._ys, self._deletable):
+            array[index:n - 1] = array[index + 1:n]
+        del self._id_to_index[self._ids.pop(index)]
+        self._n = n - 1
+        self._reindex_from(index)
+        self._bbox_dirty = True
+
+    def delete_many(self, indices: Sequence[int]):
+        """
+        Delete several vertices in one pass, keeping the order of the rest.
+
+        Repeated indices are deleted once. All indices are checked before any
+        vertex is deleted, so the buffer is left unchanged if one is invalid.
+
+        :param indices: Indices of the vertices to delete
+        :raises IndexError: If an index is outside the stored vertices
+        """
+        if len(indices) == 0:
+            return
+        n = self._n
+        unique = np.unique(np.asarray(indices, dtype=np.intp))
+        if unique[0] < 0 or unique[-1] >= n:
+            raise IndexError(f"Vertex index out of range for {n} vertices")
+        keep = np.ones(n, dtype=np.bool_)
+        keep[unique] = False
+        remaining = n - len(unique)
+        for array in (self._xs, self._ys, self._deletable):
+            array[:remaining] = array[:n][keep]
+        for index in unique.tolist():
+            del self._id_to_index[self._ids[index]]
+        self._ids = [point_id for point_id, kept in zip(self._ids, keep.tolist()) if kept]
+        self._n = remaining
+        self._reindex_from(int(unique[0]))
+        self._bbox_dirty = True
+
+    def bbox_hit(self, x: float, y: float, threshold: float) -> bool:
+        """
+        Check whether a position lies within threshold of the bounding box of the vertices.
+
+        :param x: X coordinate
+        :param y: Y coordinate
+        :param threshold: Distance the bounding box is expanded by
+        :return: True if the position is inside the expanded bounding box, False otherwise
+        """
+        if self._n == 0:
+            return False
+        if self._bbox_dirty:
+            xs, ys = self.xs, self.ys
+            self._bbox = [float(xs.min()), float(ys.min()), float(xs.max()), float(ys.max())]
+            self._bbox_dirty = False
+        min_x, min_y, max_x, max_y = self._bbox
+        return (
+            min_x - threshold <= x <= max_x + threshold
+            and min_y - threshold <= y <= max_y + threshold
+        )
+
+    def nearest_within(self, cx: float, cy: float, threshold: float) -> int | None:
+        """
+        Find the nearest deletable vertex within a distance threshold.
+
+        :param cx: X coordinate to search around
+        :param cy: Y coordinate to search around
+        :param threshold: Maximum distance
+        :return: Index of the nearest deletable vertex, or None if none is within threshold
+        """
+        n = self._n
+        if n == 0:
+            return None
+        if functions_numba.enabled():
+            index, d2 = functions_numba.nearest_deletable(self._xs, self._ys, self._deletable, n, cx, cy)
+            return index if index >= 0 and d2 <= threshold * threshold else None
+        d2 = (self._xs[:n] - cx) ** 2 + (self._ys[:n] - cy) ** 2
+        d2[~self._deletable[:n]] = np.inf
+        index = int(d2.argmin())
+        return index if d2[index] <= threshold * threshold else None
+
+    def _widen_bbox(self, x: float, y: float):
+        """
+        Grow the bounding box to include a newly added vertex.
+
+        :param x: X coordinate of the vertex
+        :param y: Y coordinate of the vertex
+        """
+        if self._bbox_dirty:
+            return
+        bbox = self._bbox
+        if x < bbox[0]:
+            bbox[0] = x
+        if y < bbox[1]:
+            bbox[1] = y
+        if x > bbox[2]:
+            bbox[2] = x
+        if y > bbox[3]:
+            bbox[3] = y
+
+    def _reindex_from(self, start: int):
+        """
+        Refresh the ID index for all vertices from the given position onwards.
+
+        :param start: First index whose position changed
+        """
+        id_to_index = self._id_to_index
+        ids = self._ids
+        for index in range(start, self._n):
+            id_to_index[ids[index]] = index
+
+    def _reserve(self, capacity: int):
+        """
+        Grow the arrays by doubling until they can hold the given number of vertices.
+
+        :param capacity: Minimum number of vertices to hold
+        """
+        new_capacity = len(self._xs)
+        while new_capacity < capacity:
+            new_capacity *= 2
+        n = self._n
+        for name in ("_xs", "_ys", "_deletable"):
+            old = getattr(self, name)
+            new = np.empty(new_capacity, dtype=old.dtype)
+            new[:n] = old[:n]
+            setattr(self, name, new)
+
+
+class VertexPointsView(Sequence[PointData2D]):
+    """Read-only sequence view that materializes PointData2D objects from a VertexBuffer2D on access."""
+
+    __slots__ = ("_buffer", "_color")
+
+    def __init__(self, buffer: VertexBuffer2D, color: str):
+        """
+        Initialize the view.
+
+        :param buffer: Vertex buffer to read from
+        :param color: Color given to the materialized points
+        """
+        self._buffer = buffer
+        self._color = color
+
+    def __len__(self) -> int:
+        """Get the number of points."""
+        return len(self._buffer)
+
+    def __getitem__(self, index):
+        """
+        Materialize the point(s) at the given index or slice.
+
+        :param index: Integer index or slice
+        :return: PointData2D, or a list of PointData2D for a slice
+        """
+        n = len(self._buffer)
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(n))]
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("point index out of range")
+        point_id, x, y, deletable = self._buffer.vertex(index)
+        return PointData2D(point_id, x, y, self._color, deletable, False)
@@ -0,0 +1,206 @@
+"""Base class for 2D plot data made of an ordered list of vertices."""
+
+from typing import List, Sequence
+
+import numpy as np
+
+from src.core.debug import DEBUG
+from src.util.logger import Logger
+
+from .base_2d_plot_data import Base2DPlotData
+from .plot_data_2d_enum import PlotData2D
+from .point_data_2d import PointData2D
+from .vertex_buffer_2d import VertexBuffer2D, VertexPointsView
+
+log = Logger(__name__)
+
+
+class VertexPlotData2D(Base2DPlotData):
+    """Base class for plot data whose points are stored in a vertex buffer."""
+
+    __slots__ = ("_buffer",)
+
+    def __init__(self, id: str, points: List[PointData2D] | None, color: str, type: PlotData2D, update: bool = True):
+        """
+        Initialize vertex plot data.
+
+        :param id: Unique identifier for the plot data
+        :param points: List of points in order, or None for no points
+        :param color: Color string
+        :param type: Plot data type from PlotData2D enum
+        :param update: Whether this plot data needs to be updated in the UI (default: True)
+        """
+        super().__init__(id, color, type, update)
+        points = points if points is not None else []
+        self._buffer = VertexBuffer2D(len(points))
+        for point in points:
+            self._buffer.append(point.id, point.x, point.y, point.deletable)
+
+        if DEBUG:
+            log.d(f"Created {type.value} with id: {id}, {len(self._buffer)} points")
+
+    @property
+    def points(self) -> VertexPointsView:
+        """Get a read-only view of the points."""
+        return VertexPointsView(self._buffer, self._color)
+
+    def xy_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get the point coordinates as arrays.
+
+        The arrays are copies, which do not change when the plot data is later modified.
+
+        :return: Tuple of (x, y) coordinate arrays
+        """
+        return self._buffer.xs.copy(), self._buffer.ys.copy()
+
+    def copy(self) -> "VertexPlotData2D":
+        """
+        Create an independent copy of the plot data, not flagged for update.
+
+        The vertex arrays are copied in bulk rather than point by point.
+
+        :return: New instance of the same class with the same points
+        """
+        clone = type(self)(self._id, None, self._color, False)
+        clone._buffer = self._buffer.copy()
+        return clone
+
+    def add_point(self, point_id: str, x: float, y: float, deletable: bool = True):
+        """
+        Add a point to the end.
+
+        :param point_id: ID of the point to add
+        :param x: X coordinate
+        :param y: Y coordinate
+        :param deletable: Whether the point can be deleted (default: True)
+        """
+        if DEBUG:
+            log.d(f"Adding point {point_id} to {self._type.value} {self._id}")
+        self._buffer.append(point_id, x, y, deletable)
+        self._mark_updated()
+
+    def add_points(self, point_ids: Sequence[str], xs: np.ndarray, ys: np.ndarray):
+        """
+        Add a block of points to the end.
+
+        :param point_ids: IDs of the points to add
+        :param xs: X coordinates
+        :param ys: Y coordinates
+        """
+        if DEBUG:
+            log.d(f"Adding {len(point_ids)} points to {self._type.value} {self._id}")
+        self._buffer.extend(point_ids, xs, ys)
+        self._mark_updated()
+
+    def insert_point(self, index: int, point_id: str, x: float, y: float, deletable: bool = True):
+        """
+        Insert a point before the given index.
+
+        :param index: Index to insert at
+        :param point_id: ID of the point to insert
+        :param x: X coordinate
+        :param y: Y coordinate
+        :param deletable: Whether the point can be deleted (default: True)
+        """
+        if DEBUG:
+            log.d(f"Inserting point {point_id} at position {index} in {self._type.value} {self._id}")
+        self._buffer.insert(index, point_id, x, y, deletable)
+        self._mark_updated()
+
+    def _is_removable(self, index: int) -> bool:
+        """
+        Check whether the point at the given index may be removed.
+
+        :param index: Index of the point
+        :return: True if the point may be removed (always, unless overridden)
+        """
+        return True
+
+    def remove_point(self, point_id: str) -> bool:
+        """
+        Remove a point by its ID.
+
+        :param point_id: ID of the point to remove
+        :return: True if point was removed, False otherwise
+        """
+        index = self._buffer.index_of(point_id)
+        if index is None:
+            log.w(f"Point {point_id} not found in {self._type.value} {self._id}")
+            return False
+
+        if not self._is_removable(index):
+            log.w(f"Cannot delete non-deletable point {point_id} from {self._type.value} {self._id}")
+            return False
+
+        if DEBUG:
+            log.d(f"Removing point {point_id} from {self._type.value} {self._id}")
+        self._buffer.delete(index)
+        self._mark_updated()
+        return True
+
+    def remove_points(self, point_ids: Sequence[str]):
+        """
+        Remove several points by their IDs in one pass.
+
+        IDs that are not part of the plot data and points that may not be removed
+        are ignored, and repeated IDs are removed once.
+
+        :param point_ids: IDs of the points to remove
+        """
+        index_of = self._buffer.index_of
+        indices = [
+            index for index in map(index_of, dict.fromkeys(point_ids))
+            if index is not None and self._is_removable(index)
+        ]
+        if DEBUG:
+            log.d(f"Removing {len(indices)} points from {self._type.value} {self._id}")
+        self._buffer.delete_many(indices)
+        self._mark_updated()
+
+    def bbox_hit(self, x: float, y: float, threshold: float) -> bool:
+        """
+        Check whether a position is within threshold of the bounding box of the points.
+
+        :param x: X coordinate
+        :param y: Y coordinate
+        :param threshold: Maximum distance
+        :return: True if the position may be near a point, False if it certainly is not
+        """
+        return self._buffer.bbox_hit(x, y, threshold)
+
+    def nearest_within(self, x: float, y: float, threshold: float) -> int | None:
+        """
+        Find the index of the nearest deletable point within a distance threshold.
+
+        :param x: X coordinate
+        :param y: Y coordinate
+        :param threshold: Maximum distance
+        :return: Index into points, or None if no deletable point is within threshold
+        """
+        return self._buffer.nearest_within(x, y, threshold)
+
+    def nearest_point(self, x: float, y: float) -> int | None:
+        """
+        Find the index of the point nearest to the given coordinates.
+
+        :param x: X coordinate
+        :param y: Y coordinate
+        :return: Index into points, or None if there are no points
+        """
+        if len(self._buffer) == 0:
+            return None
+        distances = PointData2D.distance_to_many(self._buffer.xs, self._buffer.ys, x, y)
+        return int(np.argmin(distances))
+
+    def get_point_by_id(self, point_id: str) -> PointData2D | None:
+        """
+        Get a point by its ID.
+
+        :param point_id: ID of the point
+        :return: PointData2D if found, None otherwise
+        """
+        index = self._buffer.index_of(point_id)
+        if index is None:
+            return None
+        return self.points[index]
\ No newline at end of file
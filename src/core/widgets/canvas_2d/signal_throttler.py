@@ -0,0 +1,52 @@
+"""QTimer-based signal throttler for coalescing bursts of events."""
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+
+class SignalThrottler(QObject):
+    """
+    Coalesces bursts of throttle() calls into at most one triggered emission per interval.
+
+    With leading=True the first call in a burst emits immediately and any further
+    calls within the interval collapse into a single trailing emission. With
+    leading=False only the trailing emission is made.
+    """
+
+    # Signal emitted at most once per interval
+    triggered = Signal()
+
+    def __init__(self, interval_ms: int = 16, leading: bool = True, parent: QObject | None = None):
+        """
+        Initialize the throttler.
+
+        :param interval_ms: Throttle interval in milliseconds (default: 16, roughly one frame)
+        :param leading: Whether the first call of a burst emits immediately (default: True)
+        :param parent: Parent QObject
+        """
+        super().__init__(parent)
+        self._leading = leading
+        self._pending = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._on_timeout)
+
+    def throttle(self):
+        """Request an emission of the triggered signal."""
+        if self._timer.isActive():
+            self._pending = True
+            return
+
+        if self._leading:
+            self.triggered.emit()
+        else:
+            self._pending = True
+        self._timer.start()
+
+    def _on_timeout(self):
+        """Emit the pending trailing emission, if any."""
+        if self._pending:
+            self._pending = False
+            self.triggered.emit()
+            # Keep throttling while calls keep arriving
+            self._timer.start()
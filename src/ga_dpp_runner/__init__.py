@@ -1,9 +1,10 @@
 """GA DPP Runner module for executing ga_dpp1 submodule algorithms."""
 
 from .ga_dpp_runner_qwidget import GaDPPRunnerQWidget
-from .ga_dpp_runner_qviewmodel import GaDPPRunnerQViewModel
+from .ga_dpp_runner_qviewmodel import GaDPPParams, GaDPPRunnerQViewModel
 
 __all__ = [
     "GaDPPRunnerQWidget",
     "GaDPPRunnerQViewModel",
+    "GaDPPParams",
 ]
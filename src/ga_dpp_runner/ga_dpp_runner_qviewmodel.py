@@ -2,148 +2,314 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+import pickle
+import re
+import shutil
 import subprocess
+import sys
 import tempfile
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import QObject, QThread, Signal
+from PySide6.QtCore import QObject, QRunnable, QStandardPaths, QThreadPool, QTimer, Signal, Slot
 
+from src.core.debug import DEBUG
 from src.util.logger import Logger
 
 log = Logger(__name__)
 
+# Seconds a loaded branch list is reused before git is queried again
+_BRANCH_CACHE_TTL = 15.0
+
+# Interpreter for the algorithm process: the one running the app rather than whatever "python"
+# resolves to on PATH. In a Nuitka-compiled build sys.executable is the app itself, so PATH is used.
+_PYTHON = "python" if "__compiled__" in globals() else sys.executable
+
+# Absolute path of git, resolved once. Together with passing the repository via "git -C"
+# instead of cwd=, this lets subprocess use posix_spawn rather than fork+exec on Linux,
+# which avoids duplicating the page tables of the (large) GUI process for every git call.
+_GIT = shutil.which("git") or "git"
+
+# Attributes of the DPP output that are reported back to the UI
+_OUTPUT_FIELDS = (
+    "result_1",
+    "result_2",
+    "result_3",
+    "result_4",
+    "coverage_area_acres",
+    "field_area",
+    "obstacles_area",
+    "flight_angle_degrees",
+)
+
+# One for-each-ref output line: the %(HEAD) marker ("*" or " ") followed by either
+# refs/heads/<branch> or refs/remotes/<remote>/<branch>
+_BRANCH_REF_RE = re.compile(
+    r"^(?P<head>[* ])refs/(?:(?P<local>heads/)|remotes/[^/\n]+/)(?P<name>.+)$", re.MULTILINE
+)
+
+# Known "git switch" failures, matched against its stderr, and the message shown for each
+_SWITCH_ERRORS = (
+    ("would be overwritten", "Cannot switch to {branch}: local changes would be overwritten, commit or stash them first"),
+    ("conflict", "Cannot switch to {branch}: the working tree has unresolved conflicts"),
+    ("invalid reference", "Cannot switch to {branch}: no such branch"),
+)
+
+# Fixed runner executed with "python -c"; the execute() arguments arrive pickled on stdin,
+# so no script has to be generated or written to disk per run. A fresh interpreter is used
+# so that the code of the currently checked out ga_dpp1 branch is always the one imported.
+# The static output fields are substituted once, here, rather than sent with every run.
+_RUNNER_SOURCE = """
+import json
+import pickle
+import sys
+import traceback
+
+from dppv2.main import execute
+
+OUTPUT_FIELDS = %r
+
+kwargs = pickle.load(sys.stdin.buffer)
+try:
+    dpp_out = execute(**kwargs)
+    output = {field: getattr(dpp_out, field, None) for field in OUTPUT_FIELDS}
+    print(json.dumps(output, indent=2))
+    print("\\nExecution completed successfully", file=sys.stderr)
+except Exception as e:
+    print(f"Error: {e}", file=sys.stderr)
+    traceback.print_exc()
+    sys.exit(1)
+""" % (_OUTPUT_FIELDS,)
+
 
-class GitBranchLoaderThread(QThread):
-    """Thread for loading git branches asynchronously."""
+def _decode(data: Optional[bytes]) -> str:
+    """Decode captured process output as UTF-8, independent of the locale.
 
-    branches_loaded = Signal(list)
-    error_occurred = Signal(str)
+    :param data: Captured bytes, or None if nothing was captured
+    :return: Decoded text, with undecodable bytes replaced
+    """
+    return data.decode("utf-8", errors="replace") if data else ""
+
+
+@dataclass(frozen=True, slots=True)
+class GaDPPParams:
+    """Parameters for one run of the DPP algorithm.
+
+    Field names match the arguments of dppv2.main.execute.
+    """
+
+    boundary_list: list[list[float]]
+    flight_angle_degrees: float
+    boundary_margin: float
+    obstacle_margin: list[float]
+    swath: float
+    obstacle_list: Optional[list[list[list[float]]]] = None
+    start_point: int = 1
+    perimter_scaled_no: int = 1
+    start_end_elongation_flag: int = 1
+    param_convention: int = 0
+
+
+class WorkerSignals(QObject):
+    """Signals emitted by a pooled worker; QRunnable is not a QObject and cannot emit them itself."""
+
+    result = Signal(object)  # Emitted with the result of the work
+    error_occurred = Signal(str)  # Emitted with an error message on failure
+    finished = Signal()  # Emitted after result or error_occurred
+    output_chunk = Signal(str)  # Emitted with each line of output as it arrives
+
+
+class GitBranchLoader(QRunnable):
+    """Pooled worker for loading git branches asynchronously."""
 
     def __init__(self, repo_path: Path):
-        """Initialize the branch loader thread.
+        """Initialize the branch loader.
 
         :param repo_path: Path to the git repository
         """
         super().__init__()
-        self._repo_path = repo_path
+        self.signals = WorkerSignals()
+        # subprocess needs strings; convert once rather than on every run
+        self._repo_path_str = str(repo_path)
 
     def run(self):
         """Run the branch loading process."""
         try:
+            # for-each-ref prints one full ref name per line, prefixed with "*" for the
+            # checked out branch, so the current branch comes with the same git call
             result = subprocess.run(
-                ["git", "branch", "-a"],
-                cwd=str(self._repo_path),
+                [
+                    _GIT, "-C", self._repo_path_str,
+                    "for-each-ref", "--format=%(HEAD)%(refname)", "refs/heads", "refs/remotes",
+                ],
                 capture_output=True,
-                text=True,
                 check=True,
             )
-            branches = []
-            for line in result.stdout.splitlines():
-                line = line.strip()
-                if not line:
-                    continue
-                # Remove current branch marker
-                if line.startswith("*"):
-                    line = line[1:].strip()
-                # Remove remote prefix (e.g., "remotes/origin/")
-                if "/" in line:
-                    # Take the last part after the last /
-                    line = line.split("/")[-1]
+            branches = set()
+            current = None
+            # Match all lines in one regex scan instead of splitting and slicing each line
+            for match in _BRANCH_REF_RE.finditer(_decode(result.stdout)):
+                branch = match["name"]
+                if match["local"] and match["head"] == "*":
+                    current = branch
                 # Skip HEAD references
-                if "HEAD" in line:
-                    continue
-                if line and line not in branches:
-                    branches.append(line)
-            branches.sort()
-            self.branches_loaded.emit(branches)
+                if branch != "HEAD":
+                    branches.add(branch)
+            self.signals.result.emit((sorted(branches), current))
         except subprocess.CalledProcessError as e:
-            error_msg = f"Failed to load branches: {e.stderr}"
+            error_msg = f"Failed to load branches: {_decode(e.stderr)}"
             log.e(error_msg)
-            self.error_occurred.emit(error_msg)
+            self.signals.error_occurred.emit(error_msg)
         except Exception as e:
             error_msg = f"Unexpected error loading branches: {str(e)}"
             log.e(error_msg)
-            self.error_occurred.emit(error_msg)
+            self.signals.error_occurred.emit(error_msg)
+        finally:
+            self.signals.finished.emit()
 
 
-class GitBranchChangerThread(QThread):
-    """Thread for changing git branch asynchronously."""
-
-    branch_changed = Signal(str)
-    error_occurred = Signal(str)
+class GitBranchChanger(QRunnable):
+    """Pooled worker for changing git branch asynchronously."""
 
     def __init__(self, repo_path: Path, branch_name: str):
-        """Initialize the branch changer thread.
+        """Initialize the branch changer.
 
         :param repo_path: Path to the git repository
-        :param branch_name: Name of the branch to checkout
+        :param branch_name: Name of the branch to switch to
         """
         super().__init__()
-        self._repo_path = repo_path
+        self.signals = WorkerSignals()
+        # subprocess needs strings; convert once rather than on every run
+        self._repo_path_str = str(repo_path)
         self._branch_name = branch_name
 
     def run(self):
         """Run the branch change process."""
         try:
-            result = subprocess.run(
-                ["git", "checkout", self._branch_name],
-                cwd=str(self._repo_path),
+            # switch only changes branches, so a branch name can never be mistaken for a path
+            subprocess.run(
+                [
+                    _GIT, "-C", self._repo_path_str,
+                    "-c", "advice.detachedHead=false", "switch", self._branch_name,
+                ],
                 capture_output=True,
-                text=True,
                 check=True,
             )
-            self.branch_changed.emit(self._branch_name)
+            self.signals.result.emit(self._branch_name)
         except subprocess.CalledProcessError as e:
-            error_msg = f"Failed to change branch: {e.stderr}"
+            stderr = _decode(e.stderr)
+            error_msg = next(
+                (
+                    message.format(branch=self._branch_name)
+                    for marker, message in _SWITCH_ERRORS
+                    if marker in stderr.lower()
+                ),
+                f"Failed to change branch: {stderr}",
+            )
             log.e(error_msg)
-            self.error_occurred.emit(error_msg)
+            self.signals.error_occurred.emit(error_msg)
         except Exception as e:
             error_msg = f"Unexpected error changing branch: {str(e)}"
             log.e(error_msg)
-            self.error_occurred.emit(error_msg)
-
+            self.signals.error_occurred.emit(error_msg)
+        finally:
+            self.signals.finished.emit()
 
-class ScriptExecutorThread(QThread):
-    """Thread for executing Python script asynchronously."""
 
-    execution_completed = Signal(str)
-    error_occurred = Signal(str)
+class ScriptExecutor(QRunnable):
+    """Pooled worker for executing the DPP algorithm in a separate Python process."""
 
-    def __init__(self, script_path: Path, working_dir: Path):
-        """Initialize the script executor thread.
+    def __init__(self, kwargs: dict, working_dir: Path):
+        """Initialize the script executor.
 
-        :param script_path: Path to the Python script to execute
+        :param kwargs: Keyword arguments for dppv2.main.execute
         :param working_dir: Working directory for script execution
         """
         super().__init__()
-        self._script_path = script_path
-        self._working_dir = working_dir
+        self.signals = WorkerSignals()
+        self._kwargs = kwargs
+        self._working_dir_str = str(working_dir)
 
     def run(self):
         """Run the script execution process."""
         try:
-            result = subprocess.run(
-                ["python", str(self._script_path)],
-                cwd=str(self._working_dir),
-                capture_output=True,
-                text=True,
-                check=True,
+            process = subprocess.Popen(
+                # UTF-8 mode makes the child's stdio UTF-8 regardless of the locale; -u keeps
+                # its stdout unbuffered, as a pipe would otherwise be block-buffered and
+                # nothing would arrive before the child exits
+                [_PYTHON, "-u", "-X", "utf8", "-c", _RUNNER_SOURCE],
+                cwd=self._working_dir_str,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
             )
-            output = result.stdout
-            if result.stderr:
-                output += f"\nStderr: {result.stderr}"
-            self.execution_completed.emit(output)
+            try:
+                output = self._communicate(process)
+            finally:
+                # Never leave the child running or unreaped if reading its output failed
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+            self.signals.result.emit(output)
         except subprocess.CalledProcessError as e:
-            error_msg = f"Script execution failed: {e.stderr or str(e)}"
+            error_msg = f"Script execution failed: {_decode(e.stderr) or str(e)}"
             log.e(error_msg)
-            self.error_occurred.emit(error_msg)
+            self.signals.error_occurred.emit(error_msg)
         except Exception as e:
             error_msg = f"Unexpected error executing script: {str(e)}"
             log.e(error_msg)
-            self.error_occurred.emit(error_msg)
+            self.signals.error_occurred.emit(error_msg)
+        finally:
+            self.signals.finished.emit()
+
+    def _communicate(self, process: subprocess.Popen) -> str:
+        """Send the arguments to the runner and stream its output until it exits.
+
+        :param process: Started runner process
+        :return: Standard output, followed by standard error if there was any
+        :raises subprocess.CalledProcessError: If the runner exits with a non-zero status
+        """
+        # Drain stderr on a helper thread, so a full stderr pipe cannot stall the child
+        # while stdout is being streamed
+        stderr_chunks: list[bytes] = []
+        stderr_reader = threading.Thread(
+            target=lambda: stderr_chunks.append(process.stderr.read()), daemon=True
+        )
+        stderr_reader.start()
+
+        try:
+            # Boundaries can hold thousands of points; pickle encodes and decodes the
+            # nested coordinate lists much faster than JSON does
+            process.stdin.write(pickle.dumps(self._kwargs, protocol=pickle.HIGHEST_PROTOCOL))
+            process.stdin.close()
+        except BrokenPipeError:
+            # The child exited before reading its input; its stderr says why
+            pass
+
+        # Pass each line on as it arrives instead of waiting for the child to exit
+        stdout_lines = []
+        for raw_line in iter(process.stdout.readline, b""):
+            line = _decode(raw_line)
+            stdout_lines.append(line)
+            self.signals.output_chunk.emit(line)
+        process.stdout.close()
+        returncode = process.wait()
+        stderr_reader.join()
+        stderr = b"".join(stderr_chunks)
+
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, _PYTHON, stderr=stderr)
+
+        output = "".join(stdout_lines)
+        if stderr:
+            output += f"\nStderr: {_decode(stderr)}"
+        return output
 
 
 class GaDPPRunnerQViewModel(QObject):
@@ -152,9 +318,11 @@ class GaDPPRunnerQViewModel(QObject):
     # Signals
     loading_changed = Signal(bool)  # Emitted when loading state changes
     branches_loaded = Signal(list)  # Emitted with list of branch names
+    current_branch_loaded = Signal(str)  # Emitted with the checked out branch ("" if detached)
     branch_changed = Signal(str)  # Emitted when branch change completes
     execution_started = Signal()  # Emitted when execution starts
     execution_completed = Signal(str)  # Emitted with output when execution completes
+    execution_output = Signal(str)  # Emitted with each line of output while execution runs
     execution_error = Signal(str)  # Emitted with error message on failure
 
     def __init__(self, project_root: Optional[Path] = None):
@@ -172,38 +340,205 @@ class GaDPPRunnerQViewModel(QObject):
         self._ga_dpp1_path = self._project_root / "ga_dpp1"
         self._dppv2_path = self._ga_dpp1_path / "dppv2"
 
-        # Threads for async operations
-        self._branch_loader_thread: Optional[GitBranchLoaderThread] = None
-        self._branch_changer_thread: Optional[GitBranchChangerThread] = None
-        self._script_executor_thread: Optional[ScriptExecutorThread] = None
+        # Async operations run on the global thread pool; these flags allow one of each at a time,
+        # with repeated requests joining the running one.
+        # They are only touched on the GUI thread (worker signals are queued), so need no lock.
+        self._thread_pool = QThreadPool.globalInstance()
+        self._loading_branches = False
+        self._changing_branch = False
+        self._executing = False
+        # Branch being checked out, and the one requested while it was; only the latest
+        # request is kept, as each checkout replaces the previous one
+        self._branch_target: str | None = None
+        self._queued_branch: str | None = None
+        # Parameters of the running execution, so a repeated request can join it
+        self._execution_params: GaDPPParams | None = None
+        # Running workers by their signal carrier, kept alive until they finish
+        self._workers: dict[WorkerSignals, QRunnable] = {}
+
+        # Last loaded branch list, checked out branch and when they were loaded
+        self._branches_cache: list[str] | None = None
+        self._current_branch_cache: str | None = None
+        self._branches_cache_ts: float = 0.0
+        # Refs fingerprint taken when the running branch load was started
+        self._loading_refs_fingerprint: list | None = None
+
+        # Start loading branches on the next event loop iteration, so git runs while the UI is
+        # still being built; a load_branches call made before then starts it, and this one joins
+        QTimer.singleShot(0, self.load_branches)
 
         log.d(f"Initialized GaDPPRunnerQViewModel with project root: {self._project_root}")
 
-    def load_branches(self):
-        """Load all branches from the ga_dpp1 repository."""
-        if self._branch_loader_thread and self._branch_loader_thread.isRunning():
-            log.w("Branch loader thread already running")
+    def load_branches(self, force: bool = False):
+        """Load all branches from the ga_dpp1 repository.
+
+        Calls made while a load is running join it instead of starting another git
+        process: the running load emits branches_loaded to every listener.
+
+        :param force: Whether to skip the memory and disk caches and always query git
+        """
+        if self._loading_branches:
+            log.d("Branch load already in flight, sharing its result")
+            return
+
+        # Reuse a recently loaded branch list instead of spawning git again
+        if (
+            not force
+            and self._branches_cache is not None
+            and time.monotonic() - self._branches_cache_ts < _BRANCH_CACHE_TTL
+        ):
+            log.d("Using cached branch list")
+            self._emit_branches(self._branches_cache, self._current_branch_cache)
+            self.loading_changed.emit(False)
+            return
+
+        # Reuse the list saved by an earlier session if the refs have not changed since
+        refs_fingerprint = self._refs_fingerprint()
+        cached = None if force else self._read_branches_disk_cache(refs_fingerprint)
+        if cached is not None:
+            log.d("Using branch list cached on disk")
+            self._branches_cache, self._current_branch_cache = cached
+            self._branches_cache_ts = time.monotonic()
+            self._emit_branches(*cached)
+            self.loading_changed.emit(False)
             return
 
         log.d("Loading branches from ga_dpp1 repository")
         self.loading_changed.emit(True)
 
-        self._branch_loader_thread = GitBranchLoaderThread(self._ga_dpp1_path)
-        self._branch_loader_thread.branches_loaded.connect(self._on_branches_loaded)
-        self._branch_loader_thread.error_occurred.connect(self._on_branch_loader_error)
-        self._branch_loader_thread.finished.connect(
-            lambda: self.loading_changed.emit(False)
-        )
-        self._branch_loader_thread.start()
+        self._loading_branches = True
+        self._loading_refs_fingerprint = refs_fingerprint
+        loader = GitBranchLoader(self._ga_dpp1_path)
+        loader.signals.result.connect(self._on_branches_loaded)
+        loader.signals.error_occurred.connect(self._on_branch_loader_error)
+        loader.signals.finished.connect(self._on_worker_finished)
+        self._start_worker(loader)
 
-    def _on_branches_loaded(self, branches: list[str]):
+    @Slot(object)
+    def _on_branches_loaded(self, result: tuple[list[str], Optional[str]]):
         """Handle branches loaded signal.
 
+        :param result: Tuple of (branch names, checked out branch or None if detached)
+        """
+        branches, current = result
+        if DEBUG:
+            log.d(f"Loaded {len(branches)} branches")
+        self._branches_cache = list(branches)
+        self._current_branch_cache = current
+        self._branches_cache_ts = time.monotonic()
+        self._write_branches_disk_cache(self._loading_refs_fingerprint, branches, current)
+        self._emit_branches(branches, current)
+
+    def _emit_branches(self, branches: list[str], current: Optional[str]):
+        """Emit the branch list and the checked out branch.
+
         :param branches: List of branch names
+        :param current: Checked out branch, or None if HEAD is detached
         """
-        log.d(f"Loaded {len(branches)} branches")
-        self.branches_loaded.emit(branches)
+        self.branches_loaded.emit(list(branches))
+        self.current_branch_loaded.emit(current or "")
 
+    def _git_dir(self) -> Optional[Path]:
+        """Get the git directory of the ga_dpp1 repository.
+
+        ga_dpp1 is a submodule, so its .git may be a file pointing to the real git directory.
+
+        :return: Path to the git directory, or None if it cannot be found
+        """
+        git_path = self._ga_dpp1_path / ".git"
+        if git_path.is_dir():
+            return git_path
+        try:
+            content = git_path.read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+        if not content.startswith("gitdir:"):
+            return None
+        return (self._ga_dpp1_path / content[len("gitdir:"):].strip()).resolve()
+
+    def _refs_fingerprint(self) -> Optional[list]:
+        """Get a cheap fingerprint of the branch refs of the ga_dpp1 repository.
+
+        It combines the contents of HEAD, the modification time of packed-refs and the
+        sorted names of all loose ref files under refs/heads and refs/remotes. The ref
+        directories are walked recursively, since a branch such as feature/b is stored
+        in a subdirectory whose changes do not touch the modification time of its parent.
+
+        :return: JSON-serializable fingerprint, or None if the repository cannot be read
+        """
+        git_dir = self._git_dir()
+        if git_dir is None:
+            return None
+        try:
+            head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+            packed_refs = git_dir / "packed-refs"
+            packed_mtime = packed_refs.stat().st_mtime_ns if packed_refs.exists() else None
+            refs_dir = git_dir / "refs"
+            ref_files = []
+            for top in ("heads", "remotes"):
+                for dir_path, _, file_names in os.walk(refs_dir / top):
+                    rel_dir = Path(dir_path).relative_to(refs_dir).as_posix()
+                    ref_files.extend(f"{rel_dir}/{name}" for name in file_names)
+        except OSError:
+            return None
+        return [head, packed_mtime, sorted(ref_files)]
+
+    def _branches_disk_cache_path(self) -> Path:
+        """Get the path of the file the branch list is cached in across sessions.
+
+        :return: Path of the cache file
+        """
+        cache_dir = QStandardPaths.writableLocation(
+            QStandardPaths.StandardLocation.GenericCacheLocation
+        )
+        repo_hash = hashlib.sha1(str(self._ga_dpp1_path).encode("utf-8")).hexdigest()[:12]
+        return Path(cache_dir) / "cygnus" / f"branches-{repo_hash}.json"
+
+    def _read_branches_disk_cache(
+        self, refs_fingerprint: Optional[list]
+    ) -> Optional[tuple[list[str], Optional[str]]]:
+        """Read the branch list cached on disk, if it matches the current refs.
+
+        :param refs_fingerprint: Current refs fingerprint
+        :return: Tuple of (branch names, checked out branch), or None if there is no usable cache
+        """
+        if refs_fingerprint is None:
+            return None
+        try:
+            cached = json.loads(self._branches_disk_cache_path().read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cached, dict) or cached.get("refs") != refs_fingerprint:
+            return None
+        return cached.get("branches", []), cached.get("current")
+
+    def _write_branches_disk_cache(
+        self, refs_fingerprint: Optional[list], branches: list[str], current: Optional[str]
+    ):
+        """Cache the branch list on disk together with the refs fingerprint it was loaded at.
+
+        The file is replaced atomically, so a concurrent reader never sees a partial write.
+
+        :param refs_fingerprint: Refs fingerprint taken before the branches were loaded
+        :param branches: Branch names
+        :param current: Checked out branch, or None if HEAD is detached
+        """
+        if refs_fingerprint is None:
+            return
+        cache_path = self._branches_disk_cache_path()
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=cache_path.parent, suffix=".tmp", delete=False
+            ) as tmp_file:
+                json.dump(
+                    {"refs": refs_fingerprint, "branches": branches, "current": current}, tmp_file
+                )
+            os.replace(tmp_file.name, cache_path)
+        except OSError as e:
+            log.w(f"Failed to cache branch list: {str(e)}")
+
+    @Slot(str)
     def _on_branch_loader_error(self, error_msg: str):
         """Handle branch loader error.
 
@@ -217,31 +552,42 @@ class GaDPPRunnerQViewModel(QObject):
 
         :param branch_name: Name of the branch to checkout
         """
-        if self._branch_changer_thread and self._branch_changer_thread.isRunning():
-            log.w("Branch changer thread already running")
+        if self._changing_branch:
+            if branch_name == self._branch_target:
+                if DEBUG:
+                    log.d(f"Already changing to branch: {branch_name}")
+                self._queued_branch = None
+            else:
+                if DEBUG:
+                    log.d(f"Queueing branch change to: {branch_name}")
+                self._queued_branch = branch_name
             return
 
-        log.d(f"Changing branch to: {branch_name}")
+        if DEBUG:
+            log.d(f"Changing branch to: {branch_name}")
         self.loading_changed.emit(True)
 
-        self._branch_changer_thread = GitBranchChangerThread(
-            self._ga_dpp1_path, branch_name
-        )
-        self._branch_changer_thread.branch_changed.connect(self._on_branch_changed)
-        self._branch_changer_thread.error_occurred.connect(self._on_branch_changer_error)
-        self._branch_changer_thread.finished.connect(
-            lambda: self.loading_changed.emit(False)
-        )
-        self._branch_changer_thread.start()
+        self._changing_branch = True
+        self._branch_target = branch_name
+        changer = GitBranchChanger(self._ga_dpp1_path, branch_name)
+        changer.signals.result.connect(self._on_branch_changed)
+        changer.signals.error_occurred.connect(self._on_branch_changer_error)
+        changer.signals.finished.connect(self._on_worker_finished)
+        self._start_worker(changer)
 
+    @Slot(object)
     def _on_branch_changed(self, branch_name: str):
         """Handle branch changed signal.
 
         :param branch_name: Name of the branch that was checked out
         """
-        log.d(f"Successfully changed to branch: {branch_name}")
+        if DEBUG:
+            log.d(f"Successfully changed to branch: {branch_name}")
+        # A checkout can create a local branch from a remote one, so reload next time
+        self._branches_cache = None
         self.branch_changed.emit(branch_name)
 
+    @Slot(str)
     def _on_branch_changer_error(self, error_msg: str):
         """Handle branch changer error.
 
@@ -250,131 +596,85 @@ class GaDPPRunnerQViewModel(QObject):
         log.e(f"Branch changer error: {error_msg}")
         self.execution_error.emit(error_msg)
 
-    def execute_algorithm(self, params: dict):
+    def execute_algorithm(self, params: GaDPPParams):
         """Execute the algorithm with the given parameters.
 
-        :param params: Dictionary containing algorithm parameters
+        :param params: Algorithm parameters
         """
-        if self._script_executor_thread and self._script_executor_thread.isRunning():
-            log.w("Script executor thread already running")
+        if self._executing:
+            if params == self._execution_params:
+                # The running execution already produces this result
+                log.d("Joining the running algorithm execution")
+            else:
+                self.execution_error.emit(
+                    "The algorithm is already running; wait for it to finish before running it "
+                    "with different parameters"
+                )
             return
 
         log.d("Executing algorithm with parameters")
         self.loading_changed.emit(True)
         self.execution_started.emit()
 
-        # Create execution script
-        script_path = self._create_execution_script(params)
-        if script_path is None:
-            error_msg = "Failed to create execution script"
-            log.e(error_msg)
-            self.execution_error.emit(error_msg)
-            self.loading_changed.emit(False)
-            return
-
-        # Execute script in thread
-        self._script_executor_thread = ScriptExecutorThread(
-            script_path, self._dppv2_path
-        )
-        self._script_executor_thread.execution_completed.connect(
-            self._on_execution_completed
-        )
-        self._script_executor_thread.error_occurred.connect(
-            self._on_script_executor_error
-        )
-        self._script_executor_thread.finished.connect(
-            lambda: self.loading_changed.emit(False)
-        )
-        self._script_executor_thread.start()
+        # Execute the algorithm in a separate process from a pooled worker
+        self._executing = True
+        self._execution_params = params
+        executor = ScriptExecutor(self._execution_kwargs(params), self._dppv2_path)
+        executor.signals.result.connect(self._on_execution_completed)
+        executor.signals.output_chunk.connect(self.execution_output)
+        executor.signals.error_occurred.connect(self._on_script_executor_error)
+        executor.signals.finished.connect(self._on_worker_finished)
+        self._start_worker(executor)
 
-    def _create_execution_script(self, params: dict) -> Optional[Path]:
-        """Create a Python script that executes the algorithm.
+    def _start_worker(self, worker: QRunnable):
+        """Start a worker on the thread pool, keeping it alive until it finishes.
 
-        :param params: Dictionary containing algorithm parameters
-        :return: Path to the created script, or None if creation failed
+        :param worker: Worker to start
         """
-        try:
-            # Extract parameters (skip area_threshold and settings as specified)
-            boundary_list = params.get("boundary_list", [])
-            flight_angle_degrees = params.get("flight_angle_degrees")
-            boundary_margin = params.get("boundary_margin")
-            obstacle_margin = params.get("obstacle_margin")
-            swath = params.get("swath")
-            obstacle_list = params.get("obstacle_list")
-            start_point = params.get("start_point", 1)
-            perimter_scaled_no = params.get("perimter_scaled_no", 1)
-            start_end_elongation_flag = params.get("start_end_elongation_flag", 1)
-            param_convention = params.get("param_convention", 0)
-
-            # Create temporary script file
-            script_content = f'''"""Temporary script to execute DPP algorithm."""
-
-import json
-import sys
-from dppv2.main import execute
-
-# Parameters
-boundary_list = {json.dumps(boundary_list)}
-flight_angle_degrees = {json.dumps(flight_angle_degrees)}
-boundary_margin = {json.dumps(boundary_margin)}
-obstacle_margin = {json.dumps(obstacle_margin)}
-swath = {json.dumps(swath)}
-obstacle_list = {json.dumps(obstacle_list)}
-start_point = {json.dumps(start_point)}
-perimter_scaled_no = {json.dumps(perimter_scaled_no)}
-start_end_elongation_flag = {json.dumps(start_end_elongation_flag)}
-param_convention = {json.dumps(param_convention)}
-
-try:
-    # Execute the algorithm
-    dpp_out = execute(
-        boundary_list=boundary_list,
-        flight_angle_degrees=flight_angle_degrees,
-        boundary_margin=boundary_margin,
-        obstacle_margin=obstacle_margin,
-        swath=swath,
-        area_threshold=None,  # Skipped as specified
-        obstacle_list=obstacle_list,
-        start_point=start_point,
-        perimter_scaled_no=perimter_scaled_no,
-        start_end_elongation_flag=start_end_elongation_flag,
-        param_convention=param_convention,
-        settings=None  # Skipped as specified
-    )
-    
-    # Serialize output to JSON
-    output = {{
-        "result_1": dpp_out.result_1 if hasattr(dpp_out, 'result_1') else None,
-        "result_2": dpp_out.result_2 if hasattr(dpp_out, 'result_2') else None,
-        "result_3": dpp_out.result_3 if hasattr(dpp_out, 'result_3') else None,
-        "result_4": dpp_out.result_4 if hasattr(dpp_out, 'result_4') else None,
-        "coverage_area_acres": dpp_out.coverage_area_acres if hasattr(dpp_out, 'coverage_area_acres') else None,
-        "field_area": dpp_out.field_area if hasattr(dpp_out, 'field_area') else None,
-        "obstacles_area": dpp_out.obstacles_area if hasattr(dpp_out, 'obstacles_area') else None,
-        "flight_angle_degrees": dpp_out.flight_angle_degrees if hasattr(dpp_out, 'flight_angle_degrees') else None,
-    }}
-    
-    print(json.dumps(output, indent=2))
-    print("\\nExecution completed successfully", file=sys.stderr)
-    
-except Exception as e:
-    print(f"Error: {{str(e)}}", file=sys.stderr)
-    import traceback
-    traceback.print_exc()
-    sys.exit(1)
-'''
-
-            # Create script file in dppv2 directory
-            script_path = self._dppv2_path / f"run_dpp_{os.getpid()}_{id(self)}.py"
-            script_path.write_text(script_content, encoding="utf-8")
-            log.d(f"Created execution script: {script_path}")
-
-            return script_path
-
-        except Exception as e:
-            log.e(f"Failed to create execution script: {str(e)}")
-            return None
-
+        self._workers[worker.signals] = worker
+        self._thread_pool.start(worker)
+
+    @Slot()
+    def _on_worker_finished(self):
+        """Handle any worker finishing: release it and clear its busy flag."""
+        worker = self._workers.pop(self.sender(), None)
+        if isinstance(worker, GitBranchLoader):
+            self._loading_branches = False
+        elif isinstance(worker, GitBranchChanger):
+            self._changing_branch = False
+            self._branch_target = None
+        elif isinstance(worker, ScriptExecutor):
+            self._executing = False
+            self._execution_params = None
+        self.loading_changed.emit(False)
+
+        # Run the branch change that was requested while the previous one was running
+        if self._queued_branch is not None and not self._changing_branch:
+            branch_name, self._queued_branch = self._queued_branch, None
+            self.change_branch(branch_name)
+
+    def _execution_kwargs(self, params: GaDPPParams) -> dict:
+        """Build the keyword arguments for dppv2.main.execute.
+
+        :param params: Algorithm parameters
+        :return: Keyword arguments, with area_threshold and settings skipped
+        """
+        return {
+            "boundary_list": params.boundary_list,
+            "flight_angle_degrees": params.flight_angle_degrees,
+            "boundary_margin": params.boundary_margin,
+            "obstacle_margin": params.obstacle_margin,
+            "swath": params.swath,
+            "area_threshold": None,  # Skipped as specified
+            "obstacle_list": params.obstacle_list,
+            "start_point": params.start_point,
+            "perimter_scaled_no": params.perimter_scaled_no,
+            "start_end_elongation_flag": params.start_end_elongation_flag,
+            "param_convention": params.param_convention,
+            "settings": None,  # Skipped as specified
+        }
+
+    @Slot(object)
     def _on_execution_completed(self, output: str):
         """Handle execution completed signal.
 
@@ -383,6 +683,7 @@ except Exception as e:
         log.d("Algorithm execution completed successfully")
         self.execution_completed.emit(output)
 
+    @Slot(str)
     def _on_script_executor_error(self, error_msg: str):
         """Handle script executor error.
 
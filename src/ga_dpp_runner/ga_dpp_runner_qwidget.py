@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Callable, Optional
 
-from PySide6.QtCore import Qt
+import numpy as np
+from PySide6.QtCore import QSignalBlocker, QSize, Qt, QTimer, Slot
+from PySide6.QtGui import QColor, QPainter, QPaintEvent, QPalette, QResizeEvent
 from PySide6.QtWidgets import (
     QComboBox,
     QDoubleSpinBox,
@@ -20,15 +22,19 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from src.core.debug import DEBUG
 from src.core.widgets.canvas_2d import (
     Canvas2DQWidget,
     Canvas2DQViewModel,
     Canvas2DInteractionHandler,
 )
+from src.core.widgets.canvas_2d.plot_data.canvas_2d_plot_data import Canvas2DPlotData
 from src.core.widgets.canvas_2d.plot_data.plot_data_2d_enum import PlotData2D
+from src.core.widgets.canvas_2d.plot_data.polygon_data_2d import PolygonData2D
+from src.core.widgets.canvas_2d.signal_throttler import SignalThrottler
 from src.util.logger import Logger
 
-from .ga_dpp_runner_qviewmodel import GaDPPRunnerQViewModel
+from .ga_dpp_runner_qviewmodel import GaDPPParams, GaDPPRunnerQViewModel
 
 log = Logger(__name__)
 
@@ -36,6 +42,9 @@ log = Logger(__name__)
 class LoadingOverlay(QWidget):
     """Overlay widget to show loading indicator."""
 
+    # Translucent backdrop, allocated once and painted directly instead of through a style sheet
+    _BACKGROUND = QColor(0, 0, 0, 128)
+
     def __init__(self, parent: Optional[QWidget] = None):
         """Initialize the loading overlay.
 
@@ -44,26 +53,33 @@ class LoadingOverlay(QWidget):
         super().__init__(parent)
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
-        self.setStyleSheet(
-            """
-            QWidget {
-                background-color: rgba(0, 0, 0, 128);
-            }
-            QLabel {
-                color: white;
-                font-size: 16px;
-                background-color: transparent;
-            }
-        """
-        )
 
         layout = QVBoxLayout()
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self._label = QLabel("Loading...")
         self._label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        # Style the label through its palette and font, so no style sheet has to be resolved
+        palette = self._label.palette()
+        palette.setColor(QPalette.ColorRole.WindowText, Qt.GlobalColor.white)
+        self._label.setPalette(palette)
+        font = self._label.font()
+        font.setPixelSize(16)
+        self._label.setFont(font)
         layout.addWidget(self._label)
         self.setLayout(layout)
 
+        # Size the overlay was last laid out for, so unchanged geometry is not reapplied
+        self._last_size: Optional[QSize] = None
+
+    def paintEvent(self, event: QPaintEvent):
+        """Paint the translucent backdrop.
+
+        :param event: Paint event
+        """
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), self._BACKGROUND)
+        painter.end()
+
     def set_text(self, text: str):
         """Set the loading text.
 
@@ -77,11 +93,24 @@ class LoadingOverlay(QWidget):
         :param parent_widget: Parent widget to overlay
         """
         if parent_widget:
-            self.setGeometry(parent_widget.rect())
-            self.setParent(parent_widget)
+            # Reparenting is costly and hides the widget, so only do it when the parent differs
+            if self.parent() is not parent_widget:
+                self.setParent(parent_widget)
+                self._last_size = None
+            self.update_geometry()
             self.raise_()
             self.show()
 
+    def update_geometry(self):
+        """Resize the overlay to cover its parent, if the parent's size has changed."""
+        parent_widget = self.parentWidget()
+        if parent_widget is None:
+            return
+        rect = parent_widget.rect()
+        if rect.size() != self._last_size:
+            self.setGeometry(rect)
+            self._last_size = rect.size()
+
     def hide_overlay(self):
         """Hide the overlay."""
         self.hide()
@@ -110,6 +139,8 @@ class GaDPPRunnerQWidget(QWidget):
         self._drawing_mode = "boundary"
         self._current_boundary_id: Optional[str] = None
         self._current_obstacle_ids: list[str] = []
+        # Boundary and obstacles extracted from the canvas, keyed on the plot data and its revision
+        self._extract_cache: Optional[tuple[Canvas2DPlotData, int, list, Optional[list]]] = None
 
         # UI components
         self._branch_combo: Optional[QComboBox] = None
@@ -125,20 +156,46 @@ class GaDPPRunnerQWidget(QWidget):
         self._execute_btn: Optional[QPushButton] = None
         self._status_label: Optional[QLabel] = None
         self._mode_combo: Optional[QComboBox] = None
-
-        # Loading overlay
-        self._loading_overlay = LoadingOverlay(self)
+        self._params_layout: Optional[QFormLayout] = None
+        # Execution result dialog, created on first use and reused afterwards
+        self._result_dialog: Optional[QMessageBox] = None
+        # (GaDPPParams field name, value getter) for each parameter input
+        self._param_getters: tuple[tuple[str, Callable[[], float]], ...] = ()
+
+        # The parameter inputs are built after the first paint; execution waits for them
+        self._params_ready = False
+        self._loading = False
+
+        # Loading overlay, created the first time something is loading
+        self._loading_overlay: Optional[LoadingOverlay] = None
+
+        # Streamed output lines are shown at most once per frame; only the latest one is shown
+        self._pending_output_line: Optional[str] = None
+        self._output_throttler = SignalThrottler(interval_ms=16, leading=True, parent=self)
+        self._output_throttler.triggered.connect(self._flush_output_line)
+
+        # Branch selections are debounced, so only the last one of a burst switches branches
+        self._pending_branch: Optional[str] = None
+        self._branch_debounce = QTimer(self)
+        self._branch_debounce.setSingleShot(True)
+        self._branch_debounce.setInterval(150)
+        self._branch_debounce.timeout.connect(self._flush_branch_change)
 
         self._setup_ui()
         self._connect_signals()
 
-        # Load branches on initialization
-        self._view_model.load_branches()
+        # Build the parameter inputs and load branches once the event loop runs, so the
+        # window is shown without waiting for them
+        QTimer.singleShot(0, self._setup_params)
+        QTimer.singleShot(0, self._view_model.load_branches)
 
         log.d("Initialized GaDPPRunnerQWidget")
 
     def _setup_ui(self):
-        """Set up the UI layout and components."""
+        """Set up the UI layout and components.
+
+        The parameter inputs are left empty here and filled in by _setup_params.
+        """
         main_layout = QVBoxLayout()
         main_layout.setSpacing(10)
         main_layout.setContentsMargins(10, 10, 10, 10)
@@ -167,8 +224,10 @@ class GaDPPRunnerQWidget(QWidget):
         mode_layout = QHBoxLayout()
         mode_label = QLabel("Drawing Mode:")
         self._mode_combo = QComboBox()
-        self._mode_combo.addItems(["Boundary", "Obstacle"])
-        self._mode_combo.setCurrentText("Boundary")
+        # Each item carries its drawing mode and canvas plot type (polygon for both for now)
+        self._mode_combo.addItem("Boundary", ("boundary", PlotData2D.POLYGON))
+        self._mode_combo.addItem("Obstacle", ("obstacle", PlotData2D.POLYGON))
+        self._mode_combo.setCurrentIndex(0)
         mode_layout.addWidget(mode_label)
         mode_layout.addWidget(self._mode_combo)
         mode_layout.addStretch()
@@ -185,7 +244,31 @@ class GaDPPRunnerQWidget(QWidget):
 
         # Right: Parameter inputs
         params_group = QGroupBox("Parameters")
-        params_layout = QFormLayout()
+        self._params_layout = QFormLayout()
+        params_group.setLayout(self._params_layout)
+        splitter.addWidget(params_group)
+
+        # Set splitter proportions (60% canvas, 40% params)
+        splitter.setSizes([600, 400])
+        main_layout.addWidget(splitter, stretch=1)
+
+        # Bottom section: Execute button and status
+        bottom_layout = QHBoxLayout()
+        self._execute_btn = QPushButton("Execute Algorithm")
+        # Enabled once the parameter inputs exist
+        self._execute_btn.setEnabled(False)
+        self._status_label = QLabel("Ready")
+        bottom_layout.addWidget(self._execute_btn)
+        bottom_layout.addWidget(self._status_label)
+        bottom_layout.addStretch()
+        main_layout.addLayout(bottom_layout)
+
+        self.setLayout(main_layout)
+
+    @Slot()
+    def _setup_params(self):
+        """Create the parameter inputs and enable execution."""
+        params_layout = self._params_layout
 
         self._flight_angle_spin = QDoubleSpinBox()
         self._flight_angle_spin.setRange(-180.0, 180.0)
@@ -231,141 +314,246 @@ class GaDPPRunnerQWidget(QWidget):
         self._param_convention_spin.setValue(0)
         params_layout.addRow("Param Convention:", self._param_convention_spin)
 
-        params_group.setLayout(params_layout)
-        splitter.addWidget(params_group)
-
-        # Set splitter proportions (60% canvas, 40% params)
-        splitter.setSizes([600, 400])
-        main_layout.addWidget(splitter, stretch=1)
-
-        # Bottom section: Execute button and status
-        bottom_layout = QHBoxLayout()
-        self._execute_btn = QPushButton("Execute Algorithm")
-        self._status_label = QLabel("Ready")
-        bottom_layout.addWidget(self._execute_btn)
-        bottom_layout.addWidget(self._status_label)
-        bottom_layout.addStretch()
-        main_layout.addLayout(bottom_layout)
+        self._param_getters = (
+            ("flight_angle_degrees", self._flight_angle_spin.value),
+            ("boundary_margin", self._boundary_margin_spin.value),
+            ("swath", self._swath_spin.value),
+            ("start_point", self._start_point_spin.value),
+            ("perimter_scaled_no", self._perimeter_scaled_spin.value),
+            ("start_end_elongation_flag", self._start_end_elongation_spin.value),
+            ("param_convention", self._param_convention_spin.value),
+        )
 
-        self.setLayout(main_layout)
+        self._params_ready = True
+        self._execute_btn.setEnabled(not self._loading)
 
     def _connect_signals(self):
         """Connect signals and slots."""
         # Branch management
         self._branch_combo.currentTextChanged.connect(self._on_branch_changed)
-        self._refresh_branches_btn.clicked.connect(self._view_model.load_branches)
+        self._refresh_branches_btn.clicked.connect(self._on_refresh_branches_clicked)
 
         # View model signals
         self._view_model.branches_loaded.connect(self._on_branches_loaded)
+        self._view_model.current_branch_loaded.connect(self._on_current_branch_loaded)
         self._view_model.branch_changed.connect(self._on_branch_changed_success)
         self._view_model.loading_changed.connect(self._on_loading_changed)
         self._view_model.execution_started.connect(self._on_execution_started)
         self._view_model.execution_completed.connect(self._on_execution_completed)
+        self._view_model.execution_output.connect(self._on_execution_output)
         self._view_model.execution_error.connect(self._on_execution_error)
 
         # Drawing mode
-        self._mode_combo.currentTextChanged.connect(self._on_drawing_mode_changed)
+        self._mode_combo.currentIndexChanged.connect(self._on_drawing_mode_changed)
 
         # Execute button
         self._execute_btn.clicked.connect(self._on_execute_clicked)
 
+    @Slot(list)
     def _on_branches_loaded(self, branches: list[str]):
         """Handle branches loaded signal.
 
-        :param branches: List of branch names
+        Only the branches that were added or removed are changed in the combo box,
+        so a refresh with an unchanged branch list does not touch it at all.
+
+        :param branches: List of branch names, sorted
         """
-        log.d(f"Branches loaded: {len(branches)}")
-        current_branch = self._branch_combo.currentText()
-        self._branch_combo.clear()
-        self._branch_combo.addItems(branches)
-        # Try to restore previous selection
-        if current_branch and current_branch in branches:
-            self._branch_combo.setCurrentText(current_branch)
+        if DEBUG:
+            log.d(f"Branches loaded: {len(branches)}")
+        combo = self._branch_combo
+        existing = [combo.itemText(index) for index in range(combo.count())]
+        if existing == branches:
+            return
+
+        # Repopulating is not a user selection, so it must not switch branches
+        with QSignalBlocker(combo):
+            # Removing and inserting items keeps the current item selected if it remains
+            wanted = set(branches)
+            for index in reversed(range(len(existing))):
+                if existing[index] not in wanted:
+                    combo.removeItem(index)
+            present = set(existing)
+            for index, branch in enumerate(branches):
+                if branch not in present:
+                    combo.insertItem(index, branch)
+
+            # Both lists are sorted, so this only rebuilds if the combo was populated in another order
+            if [combo.itemText(index) for index in range(combo.count())] != branches:
+                current_branch = combo.currentText()
+                combo.clear()
+                combo.addItems(branches)
+                # Try to restore previous selection
+                if current_branch and current_branch in branches:
+                    combo.setCurrentText(current_branch)
+
+    @Slot(str)
+    def _on_current_branch_loaded(self, branch_name: str):
+        """Show the checked out branch as the selected one.
+
+        Selecting it is not a user selection, so it must not switch branches.
+
+        :param branch_name: Checked out branch, or "" if HEAD is detached
+        """
+        combo = self._branch_combo
+        if branch_name and combo.findText(branch_name) >= 0:
+            with QSignalBlocker(combo):
+                combo.setCurrentText(branch_name)
+
+    @Slot()
+    def _on_refresh_branches_clicked(self):
+        """Reload the branches from git, bypassing the cached branch list."""
+        self._view_model.load_branches(force=True)
 
+    @Slot(str)
     def _on_branch_changed(self, branch_name: str):
         """Handle branch selection change.
 
         :param branch_name: Selected branch name
         """
         if branch_name:
-            log.d(f"Branch changed to: {branch_name}")
+            if DEBUG:
+                log.d(f"Branch changed to: {branch_name}")
+            # Restart the debounce; the branch is switched once the selection settles
+            self._pending_branch = branch_name
+            self._branch_debounce.start()
+
+    @Slot()
+    def _flush_branch_change(self):
+        """Switch to the last selected branch once the selection has settled."""
+        branch_name, self._pending_branch = self._pending_branch, None
+        if branch_name:
             self._view_model.change_branch(branch_name)
 
+    @Slot(str)
     def _on_branch_changed_success(self, branch_name: str):
         """Handle successful branch change.
 
         :param branch_name: Branch name that was checked out
         """
-        log.d(f"Successfully changed to branch: {branch_name}")
-        self._status_label.setText(f"Switched to branch: {branch_name}")
+        if DEBUG:
+            log.d(f"Successfully changed to branch: {branch_name}")
+        self._set_status(f"Switched to branch: {branch_name}")
 
+    @Slot(bool)
     def _on_loading_changed(self, loading: bool):
         """Handle loading state change.
 
         :param loading: Whether loading is active
         """
-        if loading:
-            self._loading_overlay.show_overlay(self)
-            self._execute_btn.setEnabled(False)
-            self._branch_combo.setEnabled(False)
-            self._refresh_branches_btn.setEnabled(False)
-        else:
-            self._loading_overlay.hide_overlay()
-            self._execute_btn.setEnabled(True)
-            self._branch_combo.setEnabled(True)
-            self._refresh_branches_btn.setEnabled(True)
-
+        if loading == self._loading:
+            return
+        self._loading = loading
+
+        # Apply all state changes with updates suspended, so they are repainted together
+        self.setUpdatesEnabled(False)
+        try:
+            if loading:
+                self._get_loading_overlay().show_overlay(self)
+            elif self._loading_overlay is not None:
+                self._loading_overlay.hide_overlay()
+            self._execute_btn.setEnabled(not loading and self._params_ready)
+            self._branch_combo.setEnabled(not loading)
+            self._refresh_branches_btn.setEnabled(not loading)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    @Slot()
     def _on_execution_started(self):
         """Handle execution started signal."""
         log.d("Execution started")
-        self._status_label.setText("Executing algorithm...")
-        self._loading_overlay.set_text("Executing algorithm...")
+        self._set_status("Executing algorithm...")
+        self._get_loading_overlay().set_text("Executing algorithm...")
+
+    def _get_loading_overlay(self) -> LoadingOverlay:
+        """Get the loading overlay, creating it on first use.
 
+        :return: Loading overlay covering this widget
+        """
+        if self._loading_overlay is None:
+            self._loading_overlay = LoadingOverlay(self)
+            # A new child widget is shown with its parent; stay hidden until asked to show
+            self._loading_overlay.hide()
+        return self._loading_overlay
+
+    @Slot(str)
+    def _on_execution_output(self, line: str):
+        """Handle a line of output from the running execution.
+
+        :param line: Output line
+        """
+        line = line.strip()
+        if line:
+            self._pending_output_line = line
+            self._output_throttler.throttle()
+
+    @Slot()
+    def _flush_output_line(self):
+        """Show the latest streamed output line in the status label."""
+        if self._pending_output_line is not None:
+            self._status_label.setText(self._pending_output_line)
+            self._pending_output_line = None
+
+    def _set_status(self, text: str):
+        """Set the status label text, dropping any output line still waiting to be shown.
+
+        :param text: Status text
+        """
+        self._pending_output_line = None
+        self._status_label.setText(text)
+
+    @Slot(str)
     def _on_execution_completed(self, output: str):
         """Handle execution completed signal.
 
         :param output: Output from execution
         """
         log.d("Execution completed")
-        self._status_label.setText("Execution completed successfully")
-        # Show output in message box
-        msg_box = QMessageBox(self)
-        msg_box.setWindowTitle("Execution Result")
-        msg_box.setText("Algorithm execution completed successfully.")
-        msg_box.setDetailedText(output)
-        msg_box.setIcon(QMessageBox.Icon.Information)
-        msg_box.exec()
-
+        self._set_status("Execution completed successfully")
+        # Show output in a non-modal message box, so the event loop keeps running
+        if self._result_dialog is None:
+            self._result_dialog = QMessageBox(self)
+            self._result_dialog.setWindowTitle("Execution Result")
+            self._result_dialog.setText("Algorithm execution completed successfully.")
+            self._result_dialog.setIcon(QMessageBox.Icon.Information)
+            self._result_dialog.setWindowModality(Qt.WindowModality.NonModal)
+        self._result_dialog.setDetailedText(output)
+        self._result_dialog.show()
+        self._result_dialog.raise_()
+
+    @Slot(str)
     def _on_execution_error(self, error_msg: str):
         """Handle execution error signal.
 
         :param error_msg: Error message
         """
         log.e(f"Execution error: {error_msg}")
-        self._status_label.setText(f"Error: {error_msg}")
+        self._set_status(f"Error: {error_msg}")
         QMessageBox.critical(self, "Execution Error", f"An error occurred:\n\n{error_msg}")
 
-    def _on_drawing_mode_changed(self, mode: str):
+    @Slot(int)
+    def _on_drawing_mode_changed(self, index: int):
         """Handle drawing mode change.
 
-        :param mode: Drawing mode ("Boundary" or "Obstacle")
+        :param index: Index of the selected drawing mode in the mode combo box
         """
-        log.d(f"Drawing mode changed to: {mode}")
-        self._drawing_mode = mode.lower()
+        mode, plot_type = self._mode_combo.itemData(index)
+        if DEBUG:
+            log.d(f"Drawing mode changed to: {mode}")
+        self._drawing_mode = mode
         # Clear current plot to allow starting new one
         self._canvas_view_model.clear_current_plot()
-        # Set plot type to polygon for both boundary and obstacle
-        self._canvas_view_model.current_plot_type = PlotData2D.POLYGON
+        # Set the plot type configured for the mode
+        self._canvas_view_model.current_plot_type = plot_type
         # Note: Colors are set in the view model (green for polygon by default)
         # We could customize colors here if needed
 
+    @Slot()
     def _on_execute_clicked(self):
         """Handle execute button click."""
         log.d("Execute button clicked")
 
         # Extract boundary and obstacles from canvas
-        boundary_list = self._extract_boundary()
-        obstacle_list = self._extract_obstacles()
+        boundary_list, obstacle_list = self._extract_polygons()
 
         if not boundary_list:
             QMessageBox.warning(
@@ -382,75 +570,87 @@ class GaDPPRunnerQWidget(QWidget):
             else []
         )
 
-        params = {
-            "boundary_list": boundary_list,
-            "flight_angle_degrees": self._flight_angle_spin.value(),
-            "boundary_margin": self._boundary_margin_spin.value(),
-            "obstacle_margin": obstacle_margin,
-            "swath": self._swath_spin.value(),
-            "obstacle_list": obstacle_list if obstacle_list else None,
-            "start_point": self._start_point_spin.value(),
-            "perimter_scaled_no": self._perimeter_scaled_spin.value(),
-            "start_end_elongation_flag": self._start_end_elongation_spin.value(),
-            "param_convention": self._param_convention_spin.value(),
-        }
-
-        log.d(f"Executing with params: {params}")
+        params = GaDPPParams(
+            boundary_list=boundary_list,
+            obstacle_margin=obstacle_margin,
+            obstacle_list=obstacle_list if obstacle_list else None,
+            **{name: getter() for name, getter in self._param_getters},
+        )
+
+        if DEBUG:
+            log.d(f"Executing with params: {params}")
         self._view_model.execute_algorithm(params)
 
-    def _extract_boundary(self) -> list[list[float]]:
-        """Extract boundary coordinates from canvas.
+    def _extract_polygons(self) -> tuple[list[list[float]], Optional[list[list[list[float]]]]]:
+        """Extract boundary and obstacle coordinates from canvas in a single pass.
 
-        :return: List of [x, y] coordinate pairs
+        The result is cached until the canvas plot data changes.
+
+        :return: Tuple of (boundary, obstacles): the boundary is a list of [x, y] coordinate
+            pairs, each obstacle a list of [x, y] coordinate pairs, or None if there are none
         """
-        boundary_list = []
         plot_data = self._canvas_view_model.plot_data
+        cache = self._extract_cache
+        if cache is not None and cache[0] is plot_data and cache[1] == plot_data.revision:
+            return cache[2], cache[3]
 
-        # Find boundary polygon (we'll use the first polygon as boundary for now)
-        # In a more sophisticated implementation, we could tag polygons
-        for plot in plot_data.get_all_plots():
-            if plot.type == PlotData2D.POLYGON:
-                # For now, use the first polygon as boundary
-                # In a real implementation, we'd track which is boundary vs obstacle
-                points = plot.points
-                if len(points) >= 3:
-                    boundary_list = [[point.x, point.y] for point in points]
-                    # Remove closing point if present
-                    if boundary_list and boundary_list[0] == boundary_list[-1]:
-                        boundary_list = boundary_list[:-1]
-                    break
-
-        return boundary_list
-
-    def _extract_obstacles(self) -> Optional[list[list[list[float]]]]:
-        """Extract obstacle coordinates from canvas.
-
-        :return: List of obstacles, where each obstacle is a list of [x, y] coordinate pairs
-        """
+        boundary_list = []
         obstacles = []
-        plot_data = self._canvas_view_model.plot_data
 
-        # Find all polygons (we'll use all polygons except the first one as obstacles)
+        # Find all polygons (we'll use the first one as boundary and the rest as obstacles)
         # In a more sophisticated implementation, we could tag polygons
+        # Enum members are singletons, so an identity test against a local suffices
+        polygon_type = PlotData2D.POLYGON
         polygons = [
             plot
             for plot in plot_data.get_all_plots()
-            if plot.type == PlotData2D.POLYGON
+            if plot.type is polygon_type
         ]
 
-        if len(polygons) > 1:
-            # Skip first polygon (boundary), use rest as obstacles
-            for plot in polygons[1:]:
-                points = plot.points
-                if len(points) >= 3:
-                    obstacle_points = [[point.x, point.y] for point in points]
-                    # Remove closing point if present
-                    if obstacle_points and obstacle_points[0] == obstacle_points[-1]:
-                        obstacle_points = obstacle_points[:-1]
-                    if obstacle_points:
-                        obstacles.append(obstacle_points)
-
-        return obstacles if obstacles else None
+        for index, plot in enumerate(polygons):
+            if len(plot.points) < 3:
+                continue
+            coords = self._polygon_coords(plot)
+            # The first polygon with at least 3 points is the boundary
+            if not boundary_list:
+                boundary_list = coords
+            # Every polygon after the first is an obstacle
+            if index > 0 and coords:
+                obstacles.append(coords)
+
+        result = boundary_list, obstacles if obstacles else None
+        self._extract_cache = (plot_data, plot_data.revision, *result)
+        return result
+
+    @staticmethod
+    def _polygon_coords(plot: PolygonData2D) -> list[list[float]]:
+        """Convert the vertices of a polygon to [x, y] coordinate pairs.
+
+        The coordinates are read from the polygon's vertex arrays in bulk rather than
+        point by point, and only turned into Python lists at the end.
+
+        :param plot: Polygon to convert
+        :return: List of [x, y] coordinate pairs, without a closing point
+        """
+        n = len(plot.points)
+        xs, ys = plot.xy_arrays()
+        # Polygons do not store a closing vertex, but a user may draw a last vertex on top
+        # of the first one; drop that duplicate, as the extraction always has, by comparing
+        # the end coordinates up front rather than building the array and trimming it
+        if n > 1 and xs[0] == xs[n - 1] and ys[0] == ys[n - 1]:
+            n -= 1
+        # The drawn ring repeats the first vertex at the end; only the stored vertices are used
+        return np.column_stack((xs[:n], ys[:n])).tolist()
+
+    def resizeEvent(self, event: QResizeEvent):
+        """Keep the loading overlay covering the widget while it is shown.
+
+        :param event: Resize event
+        """
+        super().resizeEvent(event)
+        # A hidden overlay is resized when it is next shown
+        if self._loading_overlay is not None and self._loading_overlay.isVisible():
+            self._loading_overlay.update_geometry()
 
     @property
     def view_model(self) -> GaDPPRunnerQViewModel: